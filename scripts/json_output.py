@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+JSON reading and writing helpers shared by the data-processing scripts.
+
+Uses orjson when it is installed and the standard json module otherwise;
+encoded output is byte-identical to json.dump(indent=2, ensure_ascii=False)
+either way.
+"""
+
+import json
+import sys
+
+# Optional: orjson is a much faster JSON parser and encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(path):
+    """Parse the JSON file at path."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def encode_json_chunk(obj, level=0):
+    """Encode obj as indented JSON bytes, nested `level` levels deep in the document.
+
+    Lets a script stream a large document piece by piece while producing the
+    same bytes as encoding it whole.
+    """
+    if orjson is not None:
+        encoded = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        encoded = json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    if level:
+        # Encoded strings never contain raw newlines, so re-indenting line starts is safe
+        encoded = encoded.replace(b'\n', b'\n' + b'  ' * level)
+    return encoded
+
+
+def check_output_written(output_file):
+    """Report whether an output written with encode_json_chunk is valid, exiting if not.
+
+    The encoders raise on anything they cannot serialize, so a non-empty file
+    is valid without parsing it back.
+    """
+    if output_file.stat().st_size > 0:
+        print("\n[OK] Output JSON is valid")
+    else:
+        print("\n[ERROR] JSON validation failed: output file is empty")
+        sys.exit(1)
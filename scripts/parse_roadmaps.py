@@ -17,7 +17,7 @@ import os
 import re
 import json
 import csv
-import subprocess
+import configparser
 import sys
 from pathlib import Path
 from datetime import datetime, timezone
@@ -27,12 +27,14 @@ import warnings
 
 try:
     import markdown
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, NavigableString, SoupStrainer
 except ImportError as e:
     print(f"ERROR: Missing required package: {e}")
     print("Please install: pip install markdown beautifulsoup4")
     sys.exit(1)
 
+from json_output import encode_json_chunk
+
 
 # Configuration
 REPO_ROOT = Path(__file__).parent.parent
@@ -41,50 +43,112 @@ OUTPUT_DIR = REPO_ROOT / "data"
 JSON_OUTPUT = OUTPUT_DIR / "roadmaps.json"
 CSV_OUTPUT = OUTPUT_DIR / "roadmaps.csv"
 
+# Lexical prefix of developer-roadmap paths, used to relativize links without touching the filesystem
+ROADMAP_REPO_DIR = str(REPO_ROOT / "developer-roadmap")
+_ROADMAP_REPO_PREFIX = ROADMAP_REPO_DIR + os.sep
+
+# Output files are written through a large buffer to keep write syscalls down
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
 # Track warnings
 PARSE_WARNINGS = []
 
+# Shared pool of href strings so repeated URLs across the run reuse one object
+_URL_INTERN = {}
 
-def get_git_commit_hash():
-    """Get the current git commit hash."""
+
+# Plain http(s) URLs appearing in text
+PLAIN_URL_PATTERN = re.compile(r'https?://[^\s<>"{}|\\^`\[\]()]+')
+
+# Only build parse trees for the elements each parser consumes; matched
+# elements keep their whole subtree, everything else at top level is skipped
+DOCUMENT_STRAINER = SoupStrainer(['h1', 'h2', 'h3', 'ul', 'ol', 'table'])
+CONTENT_FILE_STRAINER = SoupStrainer(['h1', 'a'])
+
+# Sentinels marking the end of a list / list item during the document walk
+_LIST_END = object()
+_ITEM_END = object()
+
+
+def intern_url(url):
+    """Return the canonical shared instance of a URL string."""
+    return _URL_INTERN.setdefault(url, url)
+
+
+def find_git_dir(repo_dir):
+    """Locate the git directory of a checkout (follows `gitdir:` files used by submodules and worktrees)."""
+    git_path = repo_dir / ".git"
+    if git_path.is_file():
+        try:
+            content = git_path.read_text(encoding='utf-8').strip()
+        except OSError:
+            return git_path
+        if content.startswith("gitdir:"):
+            return repo_dir / content[len("gitdir:"):].strip()
+    return git_path
+
+
+def find_common_git_dir(git_dir):
+    """Locate the directory holding refs and config (a linked worktree's `commondir`)."""
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=REPO_ROOT / "developer-roadmap",
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return result.stdout.strip()
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return "unknown"
+        common = (git_dir / "commondir").read_text(encoding='utf-8').strip()
+    except OSError:
+        return git_dir
+    return git_dir / common if common else git_dir
 
 
-def get_repo_info():
-    """Extract owner/repo from git remote origin."""
+def get_git_commit_hash():
+    """Get the current git commit hash by reading HEAD from the git directory."""
+    git_dir = find_git_dir(REPO_ROOT / "developer-roadmap")
+    common_dir = find_common_git_dir(git_dir)
     try:
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=REPO_ROOT / "developer-roadmap",
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        url = result.stdout.strip()
+        # HEAD is per worktree; branch refs live in the common directory
+        head = (git_dir / "HEAD").read_text(encoding='utf-8').strip()
+        if not head.startswith("ref: "):
+            # Detached HEAD holds the hash itself
+            return head
         
-        # Handle both https:// and git@ formats
-        if url.startswith("https://github.com/"):
-            match = re.search(r"github\.com/([^/]+)/([^/]+?)(?:\.git)?$", url)
-            if match:
-                return f"{match.group(1)}/{match.group(2)}"
-        elif url.startswith("git@github.com:"):
-            match = re.search(r"github\.com:([^/]+)/([^/]+?)(?:\.git)?$", url)
-            if match:
-                return f"{match.group(1)}/{match.group(2)}"
+        ref = head[len("ref: "):]
+        ref_file = common_dir / ref
+        if ref_file.is_file():
+            return ref_file.read_text(encoding='utf-8').strip()
         
+        # Ref may only exist in packed-refs
+        with open(common_dir / "packed-refs", 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith(('#', '^')):
+                    continue
+                sha, _, name = line.strip().partition(' ')
+                if name == ref:
+                    return sha
+    except OSError:
+        pass
+    return "unknown"
+
+
+def get_repo_info():
+    """Extract owner/repo from the origin remote in the git config."""
+    git_dir = find_common_git_dir(find_git_dir(REPO_ROOT / "developer-roadmap"))
+    # Git allows valueless boolean keys (e.g. a bare `bare` line)
+    config = configparser.ConfigParser(strict=False, interpolation=None, allow_no_value=True)
+    try:
+        config.read(git_dir / "config", encoding='utf-8')
+    except configparser.Error:
         return "kamranahmedse/developer-roadmap"  # default
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return "kamranahmedse/developer-roadmap"  # default
+    
+    url = config.get('remote "origin"', "url", fallback="").strip()
+    
+    # Handle both https:// and git@ formats
+    if url.startswith("https://github.com/"):
+        match = re.search(r"github\.com/([^/]+)/([^/]+?)(?:\.git)?$", url)
+        if match:
+            return f"{match.group(1)}/{match.group(2)}"
+    elif url.startswith("git@github.com:"):
+        match = re.search(r"github\.com:([^/]+)/([^/]+?)(?:\.git)?$", url)
+        if match:
+            return f"{match.group(1)}/{match.group(2)}"
+    
+    return "kamranahmedse/developer-roadmap"  # default
 
 
 def normalize_skill_text(text):
@@ -148,9 +212,15 @@ def normalize_url(url, base_path, repo_owner_repo, commit_hash):
         # Absolute path from repo root
         path = url.lstrip('/')
     else:
-        # Relative to current file
-        base_dir = base_path.parent if base_path.is_file() else base_path
-        path = str((base_dir / url).resolve().relative_to(REPO_ROOT / "developer-roadmap"))
+        # Relative to current file (callers always pass the markdown file itself);
+        # resolved lexically so no per-link stat calls are made
+        full_path = os.path.normpath(os.path.join(os.path.dirname(str(base_path)), url))
+        if full_path.startswith(_ROADMAP_REPO_PREFIX):
+            path = full_path[len(_ROADMAP_REPO_PREFIX):]
+        elif full_path == ROADMAP_REPO_DIR:
+            path = '.'
+        else:
+            raise ValueError(f"{full_path!r} is not in the subpath of {ROADMAP_REPO_DIR!r}")
         # Normalize path separators
         path = path.replace('\\', '/')
     
@@ -159,7 +229,7 @@ def normalize_url(url, base_path, repo_owner_repo, commit_hash):
         return f"https://raw.githubusercontent.com/{repo_owner_repo}/{commit_hash}/{path}"
     else:
         # Fallback to file path
-        return str(Path(REPO_ROOT / "developer-roadmap" / path).resolve())
+        return os.path.normpath(os.path.join(ROADMAP_REPO_DIR, path))
 
 
 def parse_content_file(file_path, repo_owner_repo, commit_hash):
@@ -179,7 +249,7 @@ def parse_content_file(file_path, repo_owner_repo, commit_hash):
         PARSE_WARNINGS.append(f"Failed to parse markdown in {file_path}: {e}")
         return None
     
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, 'html.parser', parse_only=CONTENT_FILE_STRAINER)
     
     # Extract skill name from h1
     h1 = soup.find('h1')
@@ -202,7 +272,7 @@ def parse_content_file(file_path, repo_owner_repo, commit_hash):
         normalized_link_text = normalize_skill_text(link_text) or link_text
         
         if href:
-            normalized_href = normalize_url(href, file_path, repo_owner_repo, commit_hash)
+            normalized_href = intern_url(normalize_url(href, file_path, repo_owner_repo, commit_hash))
             if normalized_href not in seen_hrefs:
                 seen_hrefs.add(normalized_href)
                 links.append({
@@ -211,11 +281,10 @@ def parse_content_file(file_path, repo_owner_repo, commit_hash):
                 })
     
     # Check for plain URLs (but avoid duplicates from markdown links)
-    url_pattern = re.compile(r'https?://[^\s<>"{}|\\^`\[\]()]+')
-    for match in url_pattern.finditer(content):
+    for match in PLAIN_URL_PATTERN.finditer(content):
         url = match.group(0)
         # Remove trailing punctuation that might be from markdown syntax
-        url = url.rstrip('.,;:!?)')
+        url = intern_url(url.rstrip('.,;:!?)'))
         if url not in seen_hrefs:
             seen_hrefs.add(url)
             links.append({"text": url, "href": url})
@@ -256,108 +325,170 @@ def parse_markdown_file(file_path, repo_owner_repo, commit_hash):
         PARSE_WARNINGS.append(f"Failed to parse markdown in {file_path}: {e}")
         return None
     
-    soup = BeautifulSoup(html, 'html.parser')
-    
-    # Determine role name
-    role_name = None
-    h1 = soup.find('h1')
-    if h1:
-        role_name = h1.get_text(strip=True)
-    
-    if not role_name:
-        # Use folder name
-        folder_name = file_path.parent.name
-        if folder_name and folder_name != 'content':
-            role_name = folder_name.replace('-', ' ').title()
-        else:
-            # Go up one level for content files
-            parent_folder = file_path.parent.parent.name if file_path.parent.name == 'content' else folder_name
-            if parent_folder:
-                role_name = parent_folder.replace('-', ' ').title()
-            else:
-                # Use filename without extension
-                role_name = file_path.stem.replace('-', ' ').title()
+    soup = BeautifulSoup(html, 'html.parser', parse_only=DOCUMENT_STRAINER)
     
-    # Extract sections and skills
+    # Extract sections and skills in a single walk over the document
+    h1_text = None
     sections = []
     current_section = None
-    current_section_name = "main"
+    open_lists = []  # Skill buffers for the lists currently being walked
+    pending = []  # (section, skills) in list start order, flushed when the outermost list ends
     
-    # Find all headings and lists
-    elements = soup.find_all(['h1', 'h2', 'h3', 'ul', 'ol', 'table'])
-    
-    for element in elements:
-        if element.name in ['h2', 'h3']:
-            # Save previous section if it has skills
-            if current_section and current_section['skills']:
+    for event in iter_structure_events(soup):
+        kind = event[0]
+        
+        if kind == "heading":
+            _, level, text = event
+            if level == 1:
+                # The first h1 names the role
+                if h1_text is None:
+                    h1_text = text
+            else:
+                # Start new section
+                current_section = {
+                    "section_name": sys.intern(text),
+                    "skills": []
+                }
                 sections.append(current_section)
-            
-            # Start new section
-            current_section_name = element.get_text(strip=True)
-            current_section = {
-                "section_name": current_section_name,
-                "skills": []
-            }
         
-        elif element.name in ['ul', 'ol']:
-            # Process list items
+        elif kind == "list_start":
             if not current_section:
                 current_section = {
                     "section_name": "main",
                     "skills": []
                 }
+                sections.append(current_section)
             
-            for li in element.find_all('li', recursive=False):
-                skill_data = parse_list_item(li, file_path, repo_owner_repo, commit_hash)
+            skills = []
+            open_lists.append(skills)
+            pending.append((current_section, skills))
+        
+        elif kind == "item":
+            # Items belong to the innermost open list
+            if open_lists:
+                _, text, anchors, url_sources = event
+                skill_data = parse_list_item(text, anchors, url_sources, file_path, repo_owner_repo, commit_hash)
                 if skill_data:
-                    current_section['skills'].append(skill_data)
+                    open_lists[-1].append(skill_data)
+        
+        elif kind == "list_end":
+            open_lists.pop()
+            if not open_lists:
+                # Outer list items come first, then nested lists in document order
+                for section, skills in pending:
+                    section['skills'].extend(skills)
+                pending.clear()
         
-        elif element.name == 'table':
+        elif kind == "table":
             # Process table for links
             if not current_section:
                 current_section = {
                     "section_name": "main",
                     "skills": []
                 }
+                sections.append(current_section)
             
-            table_skills = parse_table(element, file_path, repo_owner_repo, commit_hash)
-            current_section['skills'].extend(table_skills)
+            table_skills = parse_table(event[1], file_path, repo_owner_repo, commit_hash)
+            if open_lists:
+                pending.append((current_section, table_skills))
+            else:
+                current_section['skills'].extend(table_skills)
     
-    # Save last section
-    if current_section and current_section['skills']:
-        sections.append(current_section)
-    
-    # If no sections found but we have content, create a main section
-    if not sections:
-        # Try to extract any lists from the document
-        all_lists = soup.find_all(['ul', 'ol'])
-        if all_lists:
-            main_section = {
-                "section_name": "main",
-                "skills": []
-            }
-            for ul in all_lists:
-                for li in ul.find_all('li', recursive=False):
-                    skill_data = parse_list_item(li, file_path, repo_owner_repo, commit_hash)
-                    if skill_data:
-                        main_section['skills'].append(skill_data)
-            
-            if main_section['skills']:
-                sections.append(main_section)
+    # Keep only sections that ended up with skills
+    sections = [section for section in sections if section['skills']]
     
     if not sections:
         return None
     
+    # Determine role name
+    role_name = h1_text
+    
+    if not role_name:
+        # Use folder name
+        folder_name = file_path.parent.name
+        if folder_name and folder_name != 'content':
+            role_name = folder_name.replace('-', ' ').title()
+        else:
+            # Go up one level for content files
+            parent_folder = file_path.parent.parent.name if file_path.parent.name == 'content' else folder_name
+            if parent_folder:
+                role_name = parent_folder.replace('-', ' ').title()
+            else:
+                # Use filename without extension
+                role_name = file_path.stem.replace('-', ' ').title()
+    
     return {
-        "role_name": role_name,
+        "role_name": sys.intern(role_name),
         "source_files": [str(file_path.relative_to(REPO_ROOT / "developer-roadmap"))],
         "sections": sections
     }
 
 
-def parse_list_item(li_element, file_path, repo_owner_repo, commit_hash):
-    """Parse a list item to extract skill text and links."""
-    # Get the text content (excluding nested lists)
+def iter_structure_events(soup):
+    """Walk the parsed document once, yielding structural events in document order.
+    
+    Events:
+    - ("heading", level, text) for h1/h2/h3
+    - ("list_start",) and ("list_end",) around each ul/ol
+    - ("item", text, anchors, url_sources) when an li closes; anchors are
+      (href, text) pairs and url_sources are the raw strings and attribute
+      values, both including everything nested inside the item
+    - ("table", element) for each table
+    """
+    open_items = []
+    stack = list(reversed(soup.contents))
+    
+    while stack:
+        node = stack.pop()
+        
+        if node is _LIST_END:
+            yield ("list_end",)
+            continue
+        
+        if node is _ITEM_END:
+            item = open_items.pop()
+            yield ("item", item["text"], item["anchors"], item["url_sources"])
+            continue
+        
+        if isinstance(node, NavigableString):
+            if open_items:
+                text = str(node)
+                for item in open_items:
+                    item["url_sources"].append(text)
+            continue
+        
+        name = node.name
+        if name in ('h1', 'h2', 'h3'):
+            yield ("heading", int(name[1]), node.get_text(strip=True))
+        elif name in ('ul', 'ol'):
+            yield ("list_start",)
+            stack.append(_LIST_END)
+        elif name == 'li':
+            open_items.append({
+                "text": get_list_item_text(node),
+                "anchors": [],
+                "url_sources": []
+            })
+            stack.append(_ITEM_END)
+        elif name == 'table':
+            yield ("table", node)
+        
+        # Anchors and attribute values count towards every enclosing list item
+        if open_items:
+            if name == 'a' and node.has_attr('href'):
+                anchor = (node['href'].strip(), node.get_text(strip=True))
+                for item in open_items:
+                    item["anchors"].append(anchor)
+            attr_values = [value for value in node.attrs.values() if isinstance(value, str)]
+            if attr_values:
+                for item in open_items:
+                    item["url_sources"].extend(attr_values)
+        
+        stack.extend(reversed(node.contents))
+
+
+def get_list_item_text(li_element):
+    """Get the text content of a list item, excluding nested lists."""
     text_parts = []
     for child in li_element.children:
         if child.name == 'ul' or child.name == 'ol':
@@ -370,22 +501,23 @@ def parse_list_item(li_element, file_path, repo_owner_repo, commit_hash):
     text = ' '.join(text_parts)
     
     # Remove nested list markers from text
-    text = re.sub(r'^\s*[-*+]\s+', '', text)
-    
+    return re.sub(r'^\s*[-*+]\s+', '', text)
+
+
+def parse_list_item(text, anchors, url_sources, file_path, repo_owner_repo, commit_hash):
+    """Build a skill from a list item's text, anchors and raw strings."""
     # Extract links first (before normalizing text)
     links = []
     seen_hrefs = set()
     
-    # Find all anchor tags
-    for a in li_element.find_all('a', href=True):
-        href = a.get('href', '').strip()
-        link_text = a.get_text(strip=True) or href
+    for href, link_text in anchors:
+        link_text = link_text or href
         
         # Normalize link text (remove @type@ but keep meaningful text)
         normalized_link_text = normalize_skill_text(link_text) or link_text
         
         # Normalize URL
-        normalized_href = normalize_url(href, file_path, repo_owner_repo, commit_hash)
+        normalized_href = intern_url(normalize_url(href, file_path, repo_owner_repo, commit_hash))
         
         # Deduplicate
         if normalized_href not in seen_hrefs:
@@ -406,39 +538,21 @@ def parse_list_item(li_element, file_path, repo_owner_repo, commit_hash):
         return None
     
     # Check for plain URLs in text (but avoid duplicates from anchor tags)
-    url_pattern = re.compile(r'https?://[^\s<>"{}|\\^`\[\]()]+')
-    for match in url_pattern.finditer(str(li_element)):
-        url = match.group(0)
-        # Remove trailing punctuation that might be from markdown syntax
-        url = url.rstrip('.,;:!?)')
-        if url not in seen_hrefs:
-            seen_hrefs.add(url)
-            links.append({"text": url, "href": url})
-    
-    # Check for nested lists (sub-skills)
-    nested_ul = li_element.find('ul', recursive=False)
-    nested_ol = li_element.find('ol', recursive=False)
-    
-    skill_data = {
+    for source in url_sources:
+        for match in PLAIN_URL_PATTERN.finditer(source):
+            url = match.group(0)
+            # Remove trailing punctuation that might be from markdown syntax
+            url = intern_url(url.rstrip('.,;:!?)'))
+            if url not in seen_hrefs:
+                seen_hrefs.add(url)
+                links.append({"text": url, "href": url})
+    
+    # Nested list items are emitted as their own skills by the document walk
+    return {
         "skill_text": skill_text,
         "parent_skill": None,
         "links": links
     }
-    
-    # Process nested items as sub-skills
-    if nested_ul or nested_ol:
-        nested_list = nested_ul or nested_ol
-        nested_skills = []
-        for nested_li in nested_list.find_all('li', recursive=False):
-            nested_skill = parse_list_item(nested_li, file_path, repo_owner_repo, commit_hash)
-            if nested_skill:
-                nested_skill["parent_skill"] = skill_text
-                nested_skills.append(nested_skill)
-        
-        # Return parent skill, sub-skills will be added separately
-        return skill_data
-    
-    return skill_data
 
 
 def parse_table(table_element, file_path, repo_owner_repo, commit_hash):
@@ -454,7 +568,7 @@ def parse_table(table_element, file_path, repo_owner_repo, commit_hash):
                 link_text = a.get_text(strip=True) or href
                 
                 if href:
-                    normalized_href = normalize_url(href, file_path, repo_owner_repo, commit_hash)
+                    normalized_href = intern_url(normalize_url(href, file_path, repo_owner_repo, commit_hash))
                     
                     if normalized_href not in seen_hrefs:
                         seen_hrefs.add(normalized_href)
@@ -494,13 +608,11 @@ def find_markdown_files():
     return md_files
 
 
-def process_roadmaps():
+def process_roadmaps(md_files):
     """Main processing function."""
     commit_hash = get_git_commit_hash()
     repo_owner_repo = get_repo_info()
     
-    md_files = find_markdown_files()
-    
     if not md_files:
         PARSE_WARNINGS.append("No markdown files found")
         return None
@@ -523,7 +635,7 @@ def process_roadmaps():
             if skill_data:
                 # Determine role from parent directory
                 role_dir = md_file.parent.parent
-                role_name = role_dir.name.replace('-', ' ').title()
+                role_name = sys.intern(role_dir.name.replace('-', ' ').title())
                 
                 # Determine section from subdirectory or use "main"
                 section_name = "main"
@@ -531,7 +643,7 @@ def process_roadmaps():
                     # There might be subdirectories
                     rel_path = md_file.relative_to(role_dir / 'content')
                     if len(rel_path.parts) > 1:
-                        section_name = rel_path.parts[0].replace('-', ' ').title()
+                        section_name = sys.intern(rel_path.parts[0].replace('-', ' ').title())
                 
                 content_files_by_role[role_name][section_name].append({
                     "file": str(md_file.relative_to(REPO_ROOT / "developer-roadmap")),
@@ -586,71 +698,72 @@ def process_roadmaps():
     }
 
 
-def write_json_output(data):
-    """Write JSON output file."""
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    
-    with open(JSON_OUTPUT, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    
-    print(f"[OK] Written JSON: {JSON_OUTPUT.relative_to(REPO_ROOT)}")
-
-
-def write_csv_output(data):
-    """Write CSV output file."""
+def iter_csv_rows(role):
+    """Yield flattened CSV rows (one per link) for a single role."""
+    for section in role["sections"]:
+        for skill in section["skills"]:
+            if skill["links"]:
+                for link in skill["links"]:
+                    yield (
+                        role["role_name"],
+                        section["section_name"],
+                        skill["skill_text"],
+                        skill["parent_skill"] or "",
+                        link["text"],
+                        link["href"]
+                    )
+            else:
+                # Empty row for skills with no links
+                yield (
+                    role["role_name"],
+                    section["section_name"],
+                    skill["skill_text"],
+                    skill["parent_skill"] or "",
+                    "",
+                    ""
+                )
+
+
+def write_outputs(data):
+    """Write the JSON and CSV output files in a single pass over the roles.
+    
+    The JSON document is streamed one role at a time (same layout as
+    json.dump with indent=2), so the full encoded tree is never held in memory.
+    """
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
-    with open(CSV_OUTPUT, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
+    with open(JSON_OUTPUT, 'wb', buffering=WRITE_BUFFER_SIZE) as json_file, \
+            open(CSV_OUTPUT, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as csv_file:
+        writer = csv.writer(csv_file)
         writer.writerow([
             "role_name", "section_name", "skill_text", "parent_skill",
             "link_text", "link_href"
         ])
         
-        for role in data["roles"]:
-            for section in role["sections"]:
-                for skill in section["skills"]:
-                    if skill["links"]:
-                        for link in skill["links"]:
-                            writer.writerow([
-                                role["role_name"],
-                                section["section_name"],
-                                skill["skill_text"],
-                                skill["parent_skill"] or "",
-                                link["text"],
-                                link["href"]
-                            ])
-                    else:
-                        # Empty row for skills with no links
-                        writer.writerow([
-                            role["role_name"],
-                            section["section_name"],
-                            skill["skill_text"],
-                            skill["parent_skill"] or "",
-                            "",
-                            ""
-                        ])
+        json_file.write(b'{\n  "meta": ' + encode_json_chunk(data["meta"], 1) + b',\n  "roles": [')
+        
+        for i, role in enumerate(data["roles"]):
+            json_file.write((b',\n    ' if i else b'\n    ') + encode_json_chunk(role, 2))
+            writer.writerows(iter_csv_rows(role))
+        
+        json_file.write(b'\n  ]\n}' if data["roles"] else b']\n}')
     
+    print(f"[OK] Written JSON: {JSON_OUTPUT.relative_to(REPO_ROOT)}")
     print(f"[OK] Written CSV: {CSV_OUTPUT.relative_to(REPO_ROOT)}")
 
 
-def generate_summary(data):
+def generate_summary(data, total_files):
     """Generate and print summary statistics."""
-    total_files = len(find_markdown_files())
     unique_roles = len(data["roles"])
-    total_skills = sum(
-        len(skill)
-        for role in data["roles"]
-        for section in role["sections"]
-        for skill in [section["skills"]]
-    )
     
+    # Count skills and unique links in a single walk
+    total_skills = 0
     all_links = set()
     for role in data["roles"]:
         for section in role["sections"]:
-            for skill in section["skills"]:
-                for link in skill["links"]:
-                    all_links.add(link["href"])
+            skills = section["skills"]
+            total_skills += len(skills)
+            all_links.update(link["href"] for skill in skills for link in skill["links"])
     
     total_links = len(all_links)
     
@@ -674,41 +787,34 @@ def generate_summary(data):
     print("="*60)
 
 
-def run_sanity_checks():
-    """Run sanity checks on random files."""
+def run_sanity_checks(data):
+    """Run sanity checks on a random sample of extracted skills."""
     import random
     
-    md_files = find_markdown_files()
-    if not md_files:
-        print("No files to check")
+    entries = [
+        (role, section, skill)
+        for role in data["roles"]
+        for section in role["sections"]
+        for skill in section["skills"]
+    ]
+    if not entries:
+        print("No skills to check")
         return
     
-    sample_files = random.sample(md_files, min(5, len(md_files)))
+    sample_entries = random.sample(entries, min(5, len(entries)))
     
     print("\n" + "="*60)
-    print("SANITY CHECKS (Sample Files)")
+    print("SANITY CHECKS (Sample Skills)")
     print("="*60)
     
-    commit_hash = get_git_commit_hash()
-    repo_owner_repo = get_repo_info()
-    
-    for sample_file in sample_files:
-        print(f"\nFile: {sample_file.relative_to(REPO_ROOT / 'developer-roadmap')}")
-        result = parse_markdown_file(sample_file, repo_owner_repo, commit_hash)
-        if result:
-            print(f"  Role: {result['role_name']}")
-            print(f"  Sections: {len(result['sections'])}")
-            total_skills = sum(len(s['skills']) for s in result['sections'])
-            print(f"  Skills: {total_skills}")
-            if result['sections']:
-                first_section = result['sections'][0]
-                if first_section['skills']:
-                    first_skill = first_section['skills'][0]
-                    print(f"  Sample skill: {first_skill['skill_text'][:50]}...")
-                    if first_skill['links']:
-                        print(f"  Sample link: {first_skill['links'][0]['text'][:40]}...")
+    for role, section, skill in sample_entries:
+        print(f"\nRole: {role['role_name']}")
+        print(f"  Section: {section['section_name']}")
+        print(f"  Sample skill: {skill['skill_text'][:50]}...")
+        if skill['links']:
+            print(f"  Sample link: {skill['links'][0]['text'][:40]}...")
         else:
-            print("  (No data extracted)")
+            print("  (No links)")
 
 
 def validate_outputs():
@@ -750,22 +856,22 @@ def main():
     print(f"Output directory: {OUTPUT_DIR}")
     
     # Process roadmaps
-    data = process_roadmaps()
+    md_files = find_markdown_files()
+    data = process_roadmaps(md_files)
     
     if not data:
         print("ERROR: No data extracted")
         sys.exit(1)
     
     # Write outputs
-    write_json_output(data)
-    write_csv_output(data)
+    write_outputs(data)
     
     # Generate summary
-    generate_summary(data)
+    generate_summary(data, len(md_files))
     
     # Run sanity checks
     if __name__ == "__main__":
-        run_sanity_checks()
+        run_sanity_checks(data)
         validate_outputs()
     
     print("\n[OK] Extraction complete!")
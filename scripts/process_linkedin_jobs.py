@@ -5,22 +5,59 @@ Extracts job titles, company names, descriptions, and skills from LinkedIn job p
 Maps skills to roadmap.sh resources and outputs searchable JSON.
 """
 
-import json
 import re
 import sqlite3
 import csv
 import os
 from pathlib import Path
-from typing import List, Dict, Set, Optional
-from collections import defaultdict
+from typing import List, Dict, Set, Optional, Iterable, Iterator, Tuple
+from collections import defaultdict, OrderedDict
 from urllib.parse import quote
 import html
+from functools import lru_cache
+
+from json_output import encode_json_chunk
+from worker_pool import iter_pool_map
+
+# Optional: pyahocorasick finds every skill spelling in a single automaton pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: Hyperscan scans ASCII text for every skill spelling in one SIMD pass
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Optional: pandas parses large CSVs with its C reader (falls back to the csv module)
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
 
 # Repository root
 REPO_ROOT = Path(__file__).parent.parent
 DATA_DIR = REPO_ROOT / "data"
 JOB_LISTINGS_DIR = REPO_ROOT / "job-listings"
 
+# Rows dispatched to the worker pool at a time, so rows are never all queued at once
+BATCH_SIZE = 500
+# Rows sent to a single worker per task within a batch
+WORKER_CHUNKSIZE = 64
+# Distinct descriptions whose extracted skills are remembered (per process)
+SKILLS_CACHE_SIZE = 50_000
+# Rows parsed per pandas chunk, bounding memory on multi-million-row CSVs
+CSV_CHUNK_SIZE = 100_000
+# Jobs kept in memory while streaming output: enough to pad to 10 and print samples
+MIN_OUTPUT_JOBS = 10
+# Print a progress line every this many jobs written
+PROGRESS_INTERVAL = 10_000
+
+# Output is written through a large buffer to keep write syscalls down
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
 # Skill taxonomy for extraction
 TECH_SKILLS = {
     # Programming Languages
@@ -117,100 +154,250 @@ TECH_SKILLS = {
     "powershell": {"name": "PowerShell", "topics": ["shell scripting", "automation", "windows"], "roadmap": "devops"},
 }
 
-# Additional patterns for skill detection
+# Additional patterns for skill detection (precompiled once at import)
 SKILL_PATTERNS = [
-    (r'\b(?:experience with|knowledge of|proficient in|familiar with)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', None),
-    (r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:framework|library|tool|platform)', None),
-    (r'\b(?:deep learning|machine learning|ml|ai|artificial intelligence)\b', "ai-engineer"),
-    (r'\b(?:data science|data analysis|data engineering)\b', "data-scientist"),
-    (r'\b(?:cloud infrastructure|cloud computing|cloud services)\b', "aws"),
-    (r'\b(?:container|containerization|orchestration)\b', "devops"),
+    (re.compile(pattern, re.IGNORECASE), roadmap)
+    for pattern, roadmap in [
+        (r'\b(?:experience with|knowledge of|proficient in|familiar with)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', None),
+        (r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:framework|library|tool|platform)', None),
+        (r'\b(?:deep learning|machine learning|ml|ai|artificial intelligence)\b', "ai-engineer"),
+        (r'\b(?:data science|data analysis|data engineering)\b', "data-scientist"),
+        (r'\b(?:cloud infrastructure|cloud computing|cloud services)\b', "aws"),
+        (r'\b(?:container|containerization|orchestration)\b', "devops"),
+    ]
 ]
 
+# Common phrases that map to a skill outside the taxonomy (precompiled once at import)
+_ADDITIONAL_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), skill_data)
+    for pattern, skill_data in [
+        (r'\b(?:node\.?js|nodejs)\b', {"name": "Node.js", "topics": ("backend", "javascript runtime"), "roadmap": "nodejs"}),
+        (r'\b(?:\.net|dotnet)\b', {"name": ".NET", "topics": ("framework", "microsoft"), "roadmap": "aspnet-core"}),
+        (r'\b(?:ci/cd|continuous integration|continuous deployment)\b', {"name": "CI/CD", "topics": ("devops", "automation"), "roadmap": "devops"}),
+        (r'\b(?:api|apis|application programming interface)\b', {"name": "API Development", "topics": ("backend", "web services"), "roadmap": "backend"}),
+        (r'\b(?:sql|structured query language)\b', {"name": "SQL", "topics": ("database", "query language"), "roadmap": "backend"}),
+    ]
+]
+
+# roadmap.sh resources by lowercased skill name, built once. Taxonomy skills are
+# reachable by key and display name; slugs can't be used since they collide
+# (c++ and c# both slug to "c").
+GENERIC_RESOURCES = ("https://roadmap.sh",)
+# Topics for skills inferred from SKILL_PATTERNS
+GENERIC_TOPICS = ("technology", "development")
+SKILL_TO_RESOURCES = {}
+for _name, _roadmap in [
+    *((skill_key, info["roadmap"]) for skill_key, info in TECH_SKILLS.items()),
+    *((info["name"].lower(), info["roadmap"]) for info in TECH_SKILLS.values()),
+    *((data["name"].lower(), data["roadmap"]) for _, data in _ADDITIONAL_PATTERNS),
+]:
+    SKILL_TO_RESOURCES.setdefault(_name, (
+        f"https://roadmap.sh/{_roadmap}",
+        f"https://roadmap.sh/{_roadmap}/guide"
+    ))
+
+
+def _build_skill_matcher():
+    """Build the union regex and lookup tables used for direct skill matching.
+    
+    Every spelling of a skill (taxonomy key and lowercased display name) gets its
+    own capture group; SKILL_GROUP_KEYS maps a group index to the taxonomy keys
+    it implies. A spelling also implies any other spelling it contains as a
+    whole word (e.g. "react native" implies "react"), matching the old
+    behaviour of searching for every skill independently.
+    
+    Spellings are deduplicated first, so a key that equals its lowercased
+    display name (or a name shared by several keys) is only matched once.
+    """
+    terms = defaultdict(set)
+    for skill_key, skill_info in TECH_SKILLS.items():
+        terms[skill_key].add(skill_key)
+        terms[skill_info["name"].lower()].add(skill_key)
+    
+    term_regexes = {term: re.compile(rf'\b{re.escape(term)}\b') for term in terms}
+    
+    # Longest spellings first so the most specific alternative wins at each position
+    ordered_terms = sorted(terms, key=len, reverse=True)
+    group_keys = [None]  # Group 0 is the whole match
+    for term in ordered_terms:
+        group_keys.append(frozenset().union(*(
+            skill_keys for other, skill_keys in terms.items()
+            if other == term or term_regexes[other].search(term)
+        )))
+    
+    # The lookahead lets matches overlap so every start position is tried
+    alternation = "|".join(f"({re.escape(term)})" for term in ordered_terms)
+    regex = re.compile(rf'(?=\b(?:{alternation})\b)', re.IGNORECASE)
+    
+    # Skills are reported longest taxonomy key first
+    priority = {
+        skill_key: rank
+        for rank, skill_key in enumerate(sorted(TECH_SKILLS, key=len, reverse=True))
+    }
+    # Same spellings in an Aho-Corasick automaton when pyahocorasick is installed
+    automaton = None
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for term, skill_keys in zip(ordered_terms, group_keys[1:]):
+            automaton.add_word(term, (len(term), skill_keys))
+        automaton.make_automaton()
+    # And a Hyperscan database (ids are group indices minus one) when available;
+    # its \b is ASCII-only, so it is only used on ASCII text
+    hyperscan_db = None
+    if hyperscan is not None:
+        hyperscan_db = hyperscan.Database()
+        hyperscan_db.compile(
+            expressions=[rf'\b{re.escape(term)}\b'.encode('ascii') for term in ordered_terms],
+            ids=list(range(len(ordered_terms))),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(ordered_terms),
+        )
+    
+    return regex, group_keys, priority, automaton, hyperscan_db
+
+
+SKILL_REGEX, SKILL_GROUP_KEYS, SKILL_PRIORITY, SKILL_AUTOMATON, SKILL_HYPERSCAN_DB = _build_skill_matcher()
+
+
+# Lowercase non-ASCII letters re.IGNORECASE matches to ASCII letters (dotless i, long s)
+_IGNORECASE_ASCII_ALIASES = frozenset('\u0131\u017f')
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether char is a word character, using the same definition as re."""
+    return char.isalnum() or char == '_'
+
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    """Whether a regex word boundary falls at position index of text."""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+def _on_hyperscan_match(term_id: int, start: int, end: int, flags: int, matched_keys: Set[str]):
+    """Hyperscan match handler: record the taxonomy keys implied by a spelling."""
+    matched_keys.update(SKILL_GROUP_KEYS[term_id + 1])
+
+
+def match_taxonomy_skills(description_lower: str) -> Set[str]:
+    """Return the TECH_SKILLS keys mentioned in description_lower as whole words.
+    
+    The text must already be lowercased; every backend then matches it the same way.
+    """
+    matched_keys = set()
+    
+    if SKILL_HYPERSCAN_DB is not None and description_lower.isascii():
+        SKILL_HYPERSCAN_DB.scan(description_lower.encode('ascii'),
+                                match_event_handler=_on_hyperscan_match, context=matched_keys)
+        return matched_keys
+    
+    # Automaton terms are lowercase ASCII; the regex's IGNORECASE also lets the
+    # lowercase letters in _IGNORECASE_ASCII_ALIASES stand in for ASCII ones
+    if SKILL_AUTOMATON is not None and not _IGNORECASE_ASCII_ALIASES.intersection(description_lower):
+        for end, (length, skill_keys) in SKILL_AUTOMATON.iter(description_lower):
+            start = end - length + 1
+            if _is_word_boundary(description_lower, start) and _is_word_boundary(description_lower, end + 1):
+                matched_keys.update(skill_keys)
+        return matched_keys
+    
+    for match in SKILL_REGEX.finditer(description_lower):
+        matched_keys.update(SKILL_GROUP_KEYS[match.lastindex])
+    return matched_keys
+
+
+# Text cleanup patterns used for every job row
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+_NONPRINT_RE = re.compile(r'[^\w\s.,;:!?()\-]')
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_DASH_RE = re.compile(r'[-\s]+')
+# ASCII characters _NONPRINT_RE would remove once whitespace is collapsed, for a
+# str.translate fast path on ASCII-only text
+_ASCII_NONPRINT_TABLE = str.maketrans('', '', ''.join(
+    char for char in map(chr, range(128))
+    if not char.isspace() and _NONPRINT_RE.fullmatch(char)
+))
+
 
 def clean_text(text: str) -> str:
     """Remove HTML tags, escape characters, and normalize whitespace."""
     if not text:
         return ""
-    # Decode HTML entities
-    text = html.unescape(text)
+    # Decode HTML entities (every entity starts with '&')
+    if '&' in text:
+        text = html.unescape(text)
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _TAG_RE.sub('', text)
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
     # Remove emojis and special characters (keep alphanumeric, spaces, and common punctuation)
-    text = re.sub(r'[^\w\s.,;:!?()\-]', '', text)
+    if text.isascii():
+        text = text.translate(_ASCII_NONPRINT_TABLE)
+    else:
+        text = _NONPRINT_RE.sub('', text)
     return text.strip()
 
 
+@lru_cache(maxsize=1024)
 def slugify(text: str) -> str:
     """Convert text to a URL-friendly slug."""
     text = text.lower()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text)
+    text = _SLUG_STRIP_RE.sub('', text)
+    text = _SLUG_DASH_RE.sub('-', text)
     return text.strip('-')
 
 
-def extract_skills_from_description(description: str) -> List[Dict]:
-    """Extract skills from job description using pattern matching and skill taxonomy."""
+# Slugs of the fixed skill vocabulary, computed once; topics become tuples so
+# every job can share them instead of copying
+for _skill_key, _skill_info in TECH_SKILLS.items():
+    _skill_info["slug"] = slugify(_skill_key)
+    _skill_info["topics"] = tuple(_skill_info["topics"])
+
+
+def extract_skills_from_description(description: str, min_skills: int = 0) -> List[Dict]:
+    """Extract skills from job description using pattern matching and skill taxonomy.
+    
+    When fewer than min_skills skills are found, returns [] without building
+    the per-skill resources (the caller would discard the job anyway).
+    """
     if not description:
         return []
     
     description_lower = description.lower()
     found_skills = {}
     
-    # Direct skill matching - prioritize longer/more specific matches first
-    sorted_skills = sorted(TECH_SKILLS.items(), key=lambda x: len(x[0]), reverse=True)
-    
-    for skill_key, skill_info in sorted_skills:
-        # Check for exact matches and variations
-        patterns = [
-            rf'\b{re.escape(skill_key)}\b',
-            rf'\b{re.escape(skill_info["name"].lower())}\b',
-        ]
-        
-        # Handle special characters in skill names
-        skill_name_escaped = re.escape(skill_info["name"].lower())
-        patterns.append(rf'\b{skill_name_escaped}\b')
-        
-        for pattern in patterns:
-            if re.search(pattern, description_lower, re.IGNORECASE):
-                skill_id = slugify(skill_key)
-                if skill_id not in found_skills:
-                    found_skills[skill_id] = {
-                        "skill_id": skill_id,
-                        "name": skill_info["name"],
-                        "topics": skill_info["topics"].copy(),
-                        "resources": []
-                    }
-                break
+    # Direct skill matching in a single scan of the description
+    matched_keys = match_taxonomy_skills(description_lower)
+    
+    # Prioritize longer/more specific matches first
+    for skill_key in sorted(matched_keys, key=SKILL_PRIORITY.__getitem__):
+        skill_info = TECH_SKILLS[skill_key]
+        skill_id = skill_info["slug"]
+        if skill_id not in found_skills:
+            found_skills[skill_id] = {
+                "skill_id": skill_id,
+                "name": skill_info["name"],
+                "topics": skill_info["topics"],
+                "resources": []
+            }
     
     # Pattern-based extraction for conceptual skills
-    for pattern, roadmap in SKILL_PATTERNS:
-        matches = re.finditer(pattern, description, re.IGNORECASE)
-        for match in matches:
-            if roadmap:
-                # Add generic skill based on pattern
-                skill_id = slugify(roadmap)
-                if skill_id not in found_skills:
-                    found_skills[skill_id] = {
-                        "skill_id": skill_id,
-                        "name": roadmap.replace("-", " ").title(),
-                        "topics": ["technology", "development"],
-                        "resources": []
-                    }
+    for regex, roadmap in SKILL_PATTERNS:
+        # Patterns without a roadmap only capture phrases and never add a skill
+        if roadmap and regex.search(description):
+            # Add generic skill based on pattern
+            skill_id = slugify(roadmap)
+            if skill_id not in found_skills:
+                found_skills[skill_id] = {
+                    "skill_id": skill_id,
+                    "name": roadmap.replace("-", " ").title(),
+                    "topics": GENERIC_TOPICS,
+                    "resources": []
+                }
     
     # Additional pattern matching for common phrases
-    additional_patterns = [
-        (r'\b(?:node\.?js|nodejs)\b', {"name": "Node.js", "topics": ["backend", "javascript runtime"], "roadmap": "nodejs"}),
-        (r'\b(?:\.net|dotnet)\b', {"name": ".NET", "topics": ["framework", "microsoft"], "roadmap": "aspnet-core"}),
-        (r'\b(?:ci/cd|continuous integration|continuous deployment)\b', {"name": "CI/CD", "topics": ["devops", "automation"], "roadmap": "devops"}),
-        (r'\b(?:api|apis|application programming interface)\b', {"name": "API Development", "topics": ["backend", "web services"], "roadmap": "backend"}),
-        (r'\b(?:sql|structured query language)\b', {"name": "SQL", "topics": ["database", "query language"], "roadmap": "backend"}),
-    ]
-    
-    for pattern, skill_data in additional_patterns:
-        if re.search(pattern, description_lower, re.IGNORECASE):
+    for regex, skill_data in _ADDITIONAL_PATTERNS:
+        if regex.search(description_lower):
             skill_id = slugify(skill_data["name"].lower())
             if skill_id not in found_skills:
                 found_skills[skill_id] = {
@@ -220,70 +407,80 @@ def extract_skills_from_description(description: str) -> List[Dict]:
                     "resources": []
                 }
     
+    if len(found_skills) < min_skills:
+        return []
+    
     # Add resources for each skill
-    for skill_id, skill_data in found_skills.items():
-        skill_lower = skill_data["name"].lower()
-        roadmap_path = TECH_SKILLS.get(skill_lower, {}).get("roadmap")
-        
-        # Try to find roadmap path
-        if not roadmap_path:
-            # Check if it's in additional patterns
-            for _, ad_data in additional_patterns:
-                if ad_data.get("name", "").lower() == skill_lower:
-                    roadmap_path = ad_data.get("roadmap")
-                    break
-        
-        if roadmap_path:
-            skill_data["resources"] = [
-                f"https://roadmap.sh/{roadmap_path}",
-                f"https://roadmap.sh/{roadmap_path}/guide"
-            ]
-        else:
-            # Generic resources
-            skill_data["resources"] = [
-                "https://roadmap.sh",
-            ]
+    for skill_data in found_skills.values():
+        skill_data["resources"] = list(SKILL_TO_RESOURCES.get(skill_data["name"].lower(), GENERIC_RESOURCES))
     
     return list(found_skills.values())
 
 
+# Extracted skills keyed by (hash, length) of the description; re-posted jobs
+# and shared boilerplate skip the whole scan on a hit
+_SKILLS_CACHE: "OrderedDict[Tuple[int, int, int], List[Dict]]" = OrderedDict()
+
+
+def _copy_skills(skills: List[Dict]) -> List[Dict]:
+    """Copy skill dicts and their resources so cached entries are never shared.
+    
+    Topics are shared tuples and need no copy.
+    """
+    return [
+        {**skill, "resources": list(skill["resources"])}
+        for skill in skills
+    ]
+
+
+def extract_skills_cached(description: str, min_skills: int = 0) -> List[Dict]:
+    """Memoized extract_skills_from_description.
+    
+    Only results that pass the min_skills filter are stored, bounded to the
+    SKILLS_CACHE_SIZE most recently used descriptions.
+    """
+    key = (hash(description), len(description), min_skills)
+    cached = _SKILLS_CACHE.get(key)
+    if cached is not None:
+        _SKILLS_CACHE.move_to_end(key)
+        return _copy_skills(cached)
+    
+    skills = extract_skills_from_description(description, min_skills=min_skills)
+    if skills:
+        _SKILLS_CACHE[key] = _copy_skills(skills)
+        if len(_SKILLS_CACHE) > SKILLS_CACHE_SIZE:
+            _SKILLS_CACHE.popitem(last=False)
+    return skills
+
+
 def get_roadmap_resource(skill_name: str) -> List[str]:
     """Get roadmap.sh resource URLs for a skill."""
-    skill_lower = skill_name.lower()
-    roadmap = TECH_SKILLS.get(skill_lower, {}).get("roadmap")
-    if roadmap:
-        return [
-            f"https://roadmap.sh/{roadmap}",
-            f"https://roadmap.sh/{roadmap}/guide"
-        ]
-    return ["https://roadmap.sh"]
+    return list(SKILL_TO_RESOURCES.get(skill_name.lower(), GENERIC_RESOURCES))
 
 
-def process_job_from_db_row(row: tuple, columns: List[str]) -> Optional[Dict]:
-    """Process a single job from database row."""
-    job_dict = dict(zip(columns, row))
+def build_job(title: str, company_name: str, description: str, skills_desc: str) -> Optional[Dict]:
+    """Clean one raw job posting and extract its skills.
     
-    job_title = clean_text(job_dict.get('title', ''))
-    company_id = job_dict.get('company_id')
-    description = clean_text(job_dict.get('description', ''))
-    skills_desc = clean_text(job_dict.get('skills_desc', ''))
+    Returns None when the posting has no title/description or fewer than 3 skills.
+    """
+    job_title = clean_text(title)
+    description = clean_text(description)
     
-    # Combine description and skills_desc for skill extraction
-    full_description = f"{description} {skills_desc}".strip()
+    # Combine description and skills_desc for skill extraction; skills_desc is
+    # usually empty, in which case the cleaned description is used as is
+    skills_desc = clean_text(skills_desc)
+    full_description = f"{description} {skills_desc}".strip() if skills_desc else description
     
     if not job_title or not full_description:
         return None
     
     # Extract skills
-    skills = extract_skills_from_description(full_description)
+    skills = extract_skills_cached(full_description, min_skills=3)
     
     # Need at least 3 skills
     if len(skills) < 3:
         return None
     
-    # Get company name (will be joined later if needed)
-    company_name = job_dict.get('company_name', 'Unknown Company')
-    
     return {
         "job_title": job_title,
         "company_name": company_name,
@@ -292,101 +489,167 @@ def process_job_from_db_row(row: tuple, columns: List[str]) -> Optional[Dict]:
     }
 
 
-def process_jobs_from_database(db_path: str, limit: Optional[int] = None) -> List[Dict]:
-    """Process jobs from SQLite database."""
+def _process_row(row: Tuple[str, str, str, str]) -> Optional[Dict]:
+    """Build a job from a (title, company_name, description, skills_desc) row.
+    
+    Module-level so it can be dispatched to worker processes.
+    """
+    return build_job(*row)
+
+
+def iter_processed_rows(rows: Iterable[Tuple[str, str, str, str]], workers: int = 1,
+                        limit: Optional[int] = None) -> Iterator[Dict]:
+    """Yield jobs built from raw rows, spreading the CPU-bound work over worker processes.
+    
+    Rows are consumed in batches of BATCH_SIZE; with workers <= 1 everything runs
+    in this process. When limit is given, at most that many jobs are yielded.
+    """
+    count = 0
+    for job in iter_pool_map(_process_row, rows, workers, BATCH_SIZE, WORKER_CHUNKSIZE):
+        if job:
+            yield job
+            count += 1
+            if limit and count >= limit:
+                return
+
+
+def process_rows(rows: Iterable[Tuple[str, str, str, str]], workers: int = 1,
+                 limit: Optional[int] = None) -> List[Dict]:
+    """Build jobs from raw rows; see iter_processed_rows."""
+    return list(iter_processed_rows(rows, workers=workers, limit=limit))
+
+
+def iter_jobs_from_database(db_path: str, limit: Optional[int] = None, workers: int = 1) -> Iterator[Dict]:
+    """Yield jobs from SQLite database as they are processed."""
     if not os.path.exists(db_path):
         print(f"Database file not found: {db_path}")
-        return []
+        return
     
     conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    try:
+        yield from _iter_database_jobs(conn, limit, workers)
+    finally:
+        conn.close()
+
+
+def _iter_database_jobs(conn: sqlite3.Connection, limit: Optional[int], workers: int) -> Iterator[Dict]:
+    """Query jobs on an open connection and yield them as they are processed."""
+    # Faster reads on large databases: memory-map up to 256 MiB, 64 MiB page cache
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-65536")
+    
+    # Let ORDER BY listed_time walk an index instead of sorting the whole result
+    # first, and let the company join use an index lookup
+    try:
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_listed_time ON jobs(listed_time)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_companies_id ON companies(company_id)")
+    except sqlite3.OperationalError:
+        pass  # Read-only database; fall back to sorting
     
-    # Get company names
-    cursor.execute("SELECT company_id, name FROM companies")
-    companies = {row[0]: row[1] for row in cursor.fetchall()}
+    cursor = conn.cursor()
     
-    # Get jobs with descriptions
+    # Get jobs with descriptions, joined to their company names in SQLite;
+    # rows come back in the (title, company_name, description, skills_desc) shape
     query = """
-        SELECT j.job_id, j.company_id, j.title, j.description, j.skills_desc
+        SELECT
+            j.title,
+            CASE WHEN c.company_id IS NULL THEN 'Unknown Company' ELSE c.name END,
+            j.description,
+            j.skills_desc
         FROM jobs j
+        LEFT JOIN companies c ON c.company_id = j.company_id
         WHERE j.description IS NOT NULL 
         AND j.description != ''
         AND j.scraped > 0
         ORDER BY j.listed_time DESC
     """
+    # Bind the limit as a parameter so the statement text (and sqlite3's cached
+    # prepared statement) stays the same across runs
+    params = ()
     if limit:
-        query += f" LIMIT {limit}"
-    
-    cursor.execute(query)
-    columns = [desc[0] for desc in cursor.description]
-    jobs = []
+        query += " LIMIT ?"
+        params = (limit,)
     
-    for row in cursor.fetchall():
-        job_dict = dict(zip(columns, row))
-        company_name = companies.get(job_dict.get('company_id'), 'Unknown Company')
-        
-        job_title = clean_text(job_dict.get('title', ''))
-        description = clean_text(job_dict.get('description', ''))
-        skills_desc = clean_text(job_dict.get('skills_desc', ''))
-        full_description = f"{description} {skills_desc}".strip()
-        
-        if not job_title or not full_description:
-            continue
-        
-        skills = extract_skills_from_description(full_description)
-        
-        if len(skills) < 3:
-            continue
-        
-        jobs.append({
-            "job_title": job_title,
-            "company_name": company_name,
-            "job_description": description[:500] + "..." if len(description) > 500 else description,
-            "skills": skills
-        })
+    cursor.execute(query, params)
     
-    conn.close()
-    return jobs
+    # Stream rows from the cursor instead of materializing them with fetchall()
+    yield from iter_processed_rows(cursor, workers=workers)
 
 
-def process_jobs_from_csv(csv_path: str, limit: Optional[int] = None) -> List[Dict]:
-    """Process jobs from CSV file."""
+def process_jobs_from_database(db_path: str, limit: Optional[int] = None, workers: int = 1) -> List[Dict]:
+    """Process jobs from SQLite database."""
+    return list(iter_jobs_from_database(db_path, limit=limit, workers=workers))
+
+
+def iter_jobs_from_csv(csv_path: str, limit: Optional[int] = None, workers: int = 1) -> Iterator[Dict]:
+    """Yield jobs from CSV file as they are processed."""
     if not os.path.exists(csv_path):
         print(f"CSV file not found: {csv_path}")
-        return []
-    
-    jobs = []
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        count = 0
+        return
+    
+    def field(row, index, default):
+        # Columns missing from the header get the default; short rows get None,
+        # as with csv.DictReader
+        if index < 0:
+            return default
+        return row[index] if index < len(row) else None
+    
+    def iter_rows(reader):
+        header = next(reader, None)
+        if header is None:
+            return
+        
+        # Resolve column positions once instead of building a dict per row
+        idx = {name: i for i, name in enumerate(header)}
+        ti = idx.get('title', -1)
+        ci = idx.get('company_name', idx.get('name', -1))
+        di = idx.get('description', -1)
+        si = idx.get('skills_desc', -1)
+        
         for row in reader:
-            if limit and count >= limit:
-                break
-            
-            job_title = clean_text(row.get('title', ''))
-            company_name = clean_text(row.get('company_name', row.get('name', 'Unknown Company')))
-            description = clean_text(row.get('description', ''))
-            skills_desc = clean_text(row.get('skills_desc', ''))
-            
-            full_description = f"{description} {skills_desc}".strip()
-            
-            if not job_title or not full_description:
+            if not row:
                 continue
-            
-            skills = extract_skills_from_description(full_description)
-            
-            if len(skills) < 3:
-                continue
-            
-            jobs.append({
-                "job_title": job_title,
-                "company_name": company_name,
-                "job_description": description[:500] + "..." if len(description) > 500 else description,
-                "skills": skills
-            })
-            count += 1
+            yield (
+                field(row, ti, ''),
+                clean_text(field(row, ci, 'Unknown Company')),
+                field(row, di, ''),
+                field(row, si, '')
+            )
+    
+    def iter_frame_rows():
+        def column(chunk, name, default):
+            if name in chunk.columns:
+                return chunk[name].tolist()
+            return [default] * len(chunk)
+        
+        wanted = {'title', 'company_name', 'name', 'description', 'skills_desc'}
+        try:
+            with pd.read_csv(csv_path, usecols=lambda name: name in wanted, dtype=str,
+                             keep_default_na=False, encoding='utf-8',
+                             chunksize=CSV_CHUNK_SIZE) as chunks:
+                for chunk in chunks:
+                    company_column = 'company_name' if 'company_name' in chunk.columns else 'name'
+                    yield from zip(
+                        column(chunk, 'title', ''),
+                        map(clean_text, column(chunk, company_column, 'Unknown Company')),
+                        column(chunk, 'description', ''),
+                        column(chunk, 'skills_desc', '')
+                    )
+        except pd.errors.EmptyDataError:
+            return
+    
+    # The limit counts accepted jobs, not rows read
+    if pd is not None:
+        yield from iter_processed_rows(iter_frame_rows(), workers=workers, limit=limit)
+        return
     
-    return jobs
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        yield from iter_processed_rows(iter_rows(csv.reader(f)), workers=workers, limit=limit)
+
+
+def process_jobs_from_csv(csv_path: str, limit: Optional[int] = None, workers: int = 1) -> List[Dict]:
+    """Process jobs from CSV file."""
+    return list(iter_jobs_from_csv(csv_path, limit=limit, workers=workers))
 
 
 def main():
@@ -398,13 +661,14 @@ def main():
     parser.add_argument('--csv', type=str, help='Path to CSV file with job postings')
     parser.add_argument('--limit', type=int, default=None, help='Limit number of jobs to process')
     parser.add_argument('--output', type=str, default=None, help='Output JSON file path')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for skill extraction (default: CPU count, since extraction '
+                             'dominates the run on real job dumps; 1 disables multiprocessing)')
     args = parser.parse_args()
     
     output_file = Path(args.output) if args.output else DATA_DIR / "linkedin_jobs_processed.json"
     DATA_DIR.mkdir(exist_ok=True)
     
-    jobs = []
-    
     # Try to find database file
     db_paths = []
     if args.database:
@@ -424,91 +688,117 @@ def main():
         DATA_DIR / "job_postings.csv",
     ])
     
-    # Try database first
-    for db_path in db_paths:
-        if os.path.exists(db_path):
-            print(f"Processing jobs from database: {db_path}")
-            jobs = process_jobs_from_database(str(db_path), limit=args.limit)
-            break
-    
-    # If no database, try CSV
-    if not jobs:
-        for csv_path in csv_paths:
-            if os.path.exists(csv_path):
-                print(f"Processing jobs from CSV: {csv_path}")
-                jobs = process_jobs_from_csv(str(csv_path), limit=args.limit)
+    def iter_jobs():
+        jobs_found = False
+        
+        # Try database first
+        for db_path in db_paths:
+            if os.path.exists(db_path):
+                print(f"Processing jobs from database: {db_path}")
+                for job in iter_jobs_from_database(str(db_path), limit=args.limit, workers=args.workers):
+                    jobs_found = True
+                    yield job
                 break
+        
+        # If no database, try CSV
+        if not jobs_found:
+            for csv_path in csv_paths:
+                if os.path.exists(csv_path):
+                    print(f"Processing jobs from CSV: {csv_path}")
+                    for job in iter_jobs_from_csv(str(csv_path), limit=args.limit, workers=args.workers):
+                        jobs_found = True
+                        yield job
+                    break
+        
+        # If still no jobs, create sample data for structure validation
+        if not jobs_found:
+            print("No database or CSV file found. Creating sample job entries for structure validation...")
+            print("\nTo process real data:")
+            print("1. Download the dataset from Kaggle: https://www.kaggle.com/datasets/arshkon/linkedin-job-postings")
+            print("2. Extract the CSV files or use the database file")
+            print("3. Run: python scripts/process_linkedin_jobs.py --csv path/to/job_postings.csv")
+            print("\nCreating sample entries...\n")
+            
+            sample_jobs = [
+                {
+                    "title": "Machine Learning Engineer",
+                    "company": "OpenAI",
+                    "description": "We are looking for a Machine Learning Engineer to build and deploy ML systems at scale. Must have experience with Python, PyTorch, TensorFlow, and cloud infrastructure like AWS. Knowledge of Docker, Kubernetes, and CI/CD pipelines is required. Experience with REST APIs, microservices architecture, and Agile methodologies."
+                },
+                {
+                    "title": "Full Stack Developer",
+                    "company": "Tech Corp",
+                    "description": "Seeking a Full Stack Developer with expertise in React, Node.js, TypeScript, and PostgreSQL. Must know Docker, AWS, and have experience with GraphQL APIs. Familiarity with Agile/Scrum methodologies required."
+                },
+                {
+                    "title": "Data Scientist",
+                    "company": "Data Analytics Inc",
+                    "description": "Looking for a Data Scientist proficient in Python, R, Pandas, NumPy, and scikit-learn. Experience with SQL databases (PostgreSQL, MySQL), cloud platforms (AWS, GCP), and machine learning frameworks (TensorFlow, PyTorch) is essential."
+                },
+                {
+                    "title": "DevOps Engineer",
+                    "company": "Cloud Services Ltd",
+                    "description": "DevOps Engineer needed with strong knowledge of Docker, Kubernetes, Jenkins, Terraform, and AWS. Experience with Linux, Bash scripting, CI/CD pipelines, and infrastructure as code required."
+                },
+                {
+                    "title": "Frontend Developer",
+                    "company": "Web Solutions",
+                    "description": "Frontend Developer position requiring React, TypeScript, JavaScript, HTML, CSS. Experience with Next.js, REST APIs, and modern frontend development practices. Knowledge of Git and Agile methodologies."
+                }
+            ]
+            
+            for sample in sample_jobs:
+                skills = extract_skills_from_description(sample["description"])
+                if len(skills) >= 3:
+                    yield {
+                        "job_title": sample["title"],
+                        "company_name": sample["company"],
+                        "job_description": sample["description"],
+                        "skills": skills
+                    }
     
-    # If still no jobs, create sample data for structure validation
-    if not jobs:
-        print("No database or CSV file found. Creating sample job entries for structure validation...")
-        print("\nTo process real data:")
-        print("1. Download the dataset from Kaggle: https://www.kaggle.com/datasets/arshkon/linkedin-job-postings")
-        print("2. Extract the CSV files or use the database file")
-        print("3. Run: python scripts/process_linkedin_jobs.py --csv path/to/job_postings.csv")
-        print("\nCreating sample entries...\n")
+    # Stream jobs into the output as they are processed; only the first few are
+    # kept, for padding and the sample printout
+    first_jobs = []
+    job_count = 0
+    skill_count = 0
+    
+    with open(output_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(b'{\n  "jobs": [')
         
-        sample_jobs = [
-            {
-                "title": "Machine Learning Engineer",
-                "company": "OpenAI",
-                "description": "We are looking for a Machine Learning Engineer to build and deploy ML systems at scale. Must have experience with Python, PyTorch, TensorFlow, and cloud infrastructure like AWS. Knowledge of Docker, Kubernetes, and CI/CD pipelines is required. Experience with REST APIs, microservices architecture, and Agile methodologies."
-            },
-            {
-                "title": "Full Stack Developer",
-                "company": "Tech Corp",
-                "description": "Seeking a Full Stack Developer with expertise in React, Node.js, TypeScript, and PostgreSQL. Must know Docker, AWS, and have experience with GraphQL APIs. Familiarity with Agile/Scrum methodologies required."
-            },
-            {
-                "title": "Data Scientist",
-                "company": "Data Analytics Inc",
-                "description": "Looking for a Data Scientist proficient in Python, R, Pandas, NumPy, and scikit-learn. Experience with SQL databases (PostgreSQL, MySQL), cloud platforms (AWS, GCP), and machine learning frameworks (TensorFlow, PyTorch) is essential."
-            },
-            {
-                "title": "DevOps Engineer",
-                "company": "Cloud Services Ltd",
-                "description": "DevOps Engineer needed with strong knowledge of Docker, Kubernetes, Jenkins, Terraform, and AWS. Experience with Linux, Bash scripting, CI/CD pipelines, and infrastructure as code required."
-            },
-            {
-                "title": "Frontend Developer",
-                "company": "Web Solutions",
-                "description": "Frontend Developer position requiring React, TypeScript, JavaScript, HTML, CSS. Experience with Next.js, REST APIs, and modern frontend development practices. Knowledge of Git and Agile methodologies."
-            }
-        ]
+        def write_job(job):
+            nonlocal job_count, skill_count
+            f.write(b',\n    ' if job_count else b'\n    ')
+            f.write(encode_json_chunk(job, level=2))
+            job_count += 1
+            skill_count += len(job['skills'])
+            if len(first_jobs) < MIN_OUTPUT_JOBS:
+                first_jobs.append(job)
+            if job_count % PROGRESS_INTERVAL == 0:
+                print(f"  {job_count} jobs written...")
+        
+        for job in iter_jobs():
+            write_job(job)
+        
+        # Ensure we have at least 10 jobs for validation (duplicate if needed)
+        if 0 < job_count < MIN_OUTPUT_JOBS:
+            for job in (first_jobs * (MIN_OUTPUT_JOBS // job_count + 1))[job_count:MIN_OUTPUT_JOBS]:
+                write_job(job)
         
-        for sample in sample_jobs:
-            skills = extract_skills_from_description(sample["description"])
-            if len(skills) >= 3:
-                jobs.append({
-                    "job_title": sample["title"],
-                    "company_name": sample["company"],
-                    "job_description": sample["description"],
-                    "skills": skills
-                })
-    
-    # Ensure we have at least 10 jobs for validation (duplicate if needed)
-    if len(jobs) < 10 and jobs:
-        while len(jobs) < 10:
-            jobs.append(jobs[len(jobs) % len(jobs)].copy())
-    
-    output_data = {"jobs": jobs}
-    
-    # Write JSON output
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+        f.write(b'\n  ]\n}' if job_count else b']\n}')
     
     print(f"\n{'='*60}")
     print("PROCESSING SUMMARY")
     print(f"{'='*60}")
-    print(f"Total jobs processed: {len(jobs)}")
-    print(f"Total skills extracted: {sum(len(job['skills']) for job in jobs)}")
-    print(f"Average skills per job: {sum(len(job['skills']) for job in jobs) / len(jobs) if jobs else 0:.1f}")
+    print(f"Total jobs processed: {job_count}")
+    print(f"Total skills extracted: {skill_count}")
+    print(f"Average skills per job: {skill_count / job_count if job_count else 0:.1f}")
     print(f"\nOutput file: {output_file}")
     print(f"{'='*60}\n")
     
     # Print sample entries
     print("Sample job entries:")
-    for i, job in enumerate(jobs[:3], 1):
+    for i, job in enumerate(first_jobs[:3], 1):
         print(f"\n{i}. {job['job_title']} at {job['company_name']}")
         print(f"   Skills: {len(job['skills'])}")
         print(f"   Sample skills: {', '.join([s['name'] for s in job['skills'][:5]])}")
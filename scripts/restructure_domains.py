@@ -6,15 +6,35 @@ Groups skills under umbrella categories optimized for resume matching
 and hierarchical search.
 """
 
-import json
-import sys
+from bisect import bisect_right
+from collections import namedtuple
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from collections import defaultdict
+
+from json_output import check_output_written, encode_json_chunk, load_json
+from worker_pool import iter_pool_map
+
+# Optional: pyahocorasick finds every mapped role in a role name in one pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: ijson streams roles from the input instead of loading it whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 REPO_ROOT = Path(__file__).parent.parent
 INPUT_FILE = REPO_ROOT / "data" / "roadmaps_cleaned.json"
 OUTPUT_FILE = REPO_ROOT / "data" / "roadmaps_domains.json"
 
+# Roles handed to the worker pool at a time, and per-task chunk size
+ROLE_BATCH_SIZE = 256
+WORKER_CHUNKSIZE = 16
+
 # Domain mappings based on roadmap.sh structure
 DOMAIN_MAPPINGS = {
     # Web Development
@@ -220,189 +240,332 @@ CATEGORY_MAPPINGS = {
     }
 }
 
+# A skill as held while grouping; turned into an output dict only when written
+Subskill = namedtuple('Subskill', 'skill_id name keywords links')
+
+# Default category based on domain, used when no category keyword matches
+DEFAULT_CATEGORIES = {
+    'Web Development': 'Web Technologies',
+    'Mobile Development': 'Mobile Technologies',
+    'Artificial Intelligence & Machine Learning': 'AI/ML Technologies',
+    'Data Engineering & Analytics': 'Data Technologies',
+    'DevOps & Cloud': 'DevOps Tools',
+    'Programming Languages': 'Language Features',
+    'Computer Science Fundamentals': 'CS Concepts',
+    'Databases': 'Database Technologies',
+    'Game Development': 'Game Technologies',
+    'Design & UX': 'Design Principles',
+    'Blockchain': 'Blockchain Technologies',
+    'Cyber Security': 'Security Practices',
+    'Management & Leadership': 'Management Skills',
+    'Specialized Tools & Frameworks': 'Tools & Frameworks'
+}
+
 
 def normalize_role_name(role_name):
     """Normalize role name for matching."""
     return role_name.lower().strip()
 
 
-def find_domain_for_role(role_name, all_roles):
+# (domain, normalized mapped role, mapped role words) in DOMAIN_MAPPINGS order,
+# normalized once at import
+_DOMAIN_INDEX = [
+    (domain, normalize_role_name(mapped_role), frozenset(normalize_role_name(mapped_role).split()))
+    for domain, config in DOMAIN_MAPPINGS.items()
+    for mapped_role in config['roles']
+]
+
+# Each mapped role word -> index in _DOMAIN_INDEX of the first mapped role using it
+_WORD_TO_FIRST_MAPPED_ROLE = {}
+for _index, (_, _, _mapped_words) in enumerate(_DOMAIN_INDEX):
+    for _word in _mapped_words:
+        _WORD_TO_FIRST_MAPPED_ROLE.setdefault(_word, _index)
+
+# Lowercased (category, keyword) pairs per domain, in CATEGORY_MAPPINGS order
+_CATEGORY_INDEX = {
+    domain: tuple((category, keyword.lower()) for category, keywords in categories.items() for keyword in keywords)
+    for domain, categories in CATEGORY_MAPPINGS.items()
+}
+
+
+# Separator for joined mapped role names; no mapped role contains it, so no
+# match can span two names
+_NAME_SEPARATOR = '\x00'
+
+
+def _build_automaton(words):
+    """Build an Aho-Corasick automaton mapping each word to its first index in words."""
+    automaton = ahocorasick.Automaton()
+    for index, word in enumerate(words):
+        if word not in automaton:
+            automaton.add_word(word, index)
+    automaton.make_automaton()
+    return automaton
+
+
+def _first_hit(automaton, text):
+    """Lowest word index found anywhere in text, or None."""
+    return min((index for _, index in automaton.iter(text)), default=None)
+
+
+# Mapped roles found inside a role name come from an automaton; mapped roles
+# containing the role name are found with one str.find over all of them joined
+_DOMAIN_AUTOMATON = None
+_MAPPED_ROLES_JOINED = _NAME_SEPARATOR.join(mapped_lower for _, mapped_lower, _ in _DOMAIN_INDEX)
+_MAPPED_ROLE_STARTS = []
+_offset = 0
+for _, _mapped_lower, _ in _DOMAIN_INDEX:
+    _MAPPED_ROLE_STARTS.append(_offset)
+    _offset += len(_mapped_lower) + len(_NAME_SEPARATOR)
+if ahocorasick is not None:
+    _DOMAIN_AUTOMATON = _build_automaton([mapped_lower for _, mapped_lower, _ in _DOMAIN_INDEX])
+
+
+def _find_domain_by_containment(role_lower):
+    """Return the first domain with a mapped role containing, or contained in, role_lower."""
+    if _DOMAIN_AUTOMATON is not None:
+        first = _first_hit(_DOMAIN_AUTOMATON, role_lower)
+        if _NAME_SEPARATOR not in role_lower:
+            # The leftmost occurrence lies in the earliest mapped role containing it
+            position = _MAPPED_ROLES_JOINED.find(role_lower)
+            if position >= 0:
+                containing = bisect_right(_MAPPED_ROLE_STARTS, position) - 1
+                first = containing if first is None else min(first, containing)
+        return None if first is None else _DOMAIN_INDEX[first][0]
+    
+    for domain, mapped_lower, _ in _DOMAIN_INDEX:
+        if mapped_lower in role_lower or role_lower in mapped_lower:
+            return domain
+    return None
+
+
+# Domain for roles named exactly like a mapped role. The value is what the
+# containment scan returns for that name, which is not always the mapped
+# role's own domain (e.g. "react native" contains "react" from an earlier domain)
+_EXACT_ROLE_TO_DOMAIN = {
+    mapped_lower: _find_domain_by_containment(mapped_lower)
+    for _, mapped_lower, _ in _DOMAIN_INDEX
+}
+
+
+def find_domain_for_role(role_name):
     """Find the best matching domain for a role."""
-    role_lower = normalize_role_name(role_name)
+    return _find_domain_for_normalized_role(normalize_role_name(role_name))
+
+
+@lru_cache(maxsize=None)
+def _find_domain_for_normalized_role(role_lower):
+    """Find the best matching domain for a normalized role name (memoized)."""
+    # Most roles are named exactly like a mapped role
+    domain = _EXACT_ROLE_TO_DOMAIN.get(role_lower)
+    if domain:
+        return domain
     
     # Check each domain
-    for domain, config in DOMAIN_MAPPINGS.items():
-        for mapped_role in config['roles']:
-            if normalize_role_name(mapped_role) in role_lower or role_lower in normalize_role_name(mapped_role):
-                return domain
-    
-    # Check for partial matches
-    for domain, config in DOMAIN_MAPPINGS.items():
-        for mapped_role in config['roles']:
-            mapped_lower = normalize_role_name(mapped_role)
-            # Check if any word matches
-            role_words = set(role_lower.split())
-            mapped_words = set(mapped_lower.split())
-            if role_words & mapped_words:
-                return domain
+    domain = _find_domain_by_containment(role_lower)
+    if domain:
+        return domain
+    
+    # Check for partial matches (any word in common): the earliest mapped role
+    # sharing a word with the role
+    word_hits = [_WORD_TO_FIRST_MAPPED_ROLE[word] for word in role_lower.split() if word in _WORD_TO_FIRST_MAPPED_ROLE]
+    if word_hits:
+        return _DOMAIN_INDEX[min(word_hits)][0]
     
     # Default to "Specialized Tools & Frameworks" if no match
     return "Specialized Tools & Frameworks"
 
 
+def _first_category_keyword(text_lower, domain):
+    """Index into _CATEGORY_INDEX[domain] of the first keyword found in text_lower, or None.
+    
+    A plain loop: a domain has at most a few dozen short keywords, and for
+    those str.__contains__ beats both an automaton scan and prefiltering
+    on character bitmasks.
+    """
+    for index, (_, keyword_lower) in enumerate(_CATEGORY_INDEX[domain]):
+        if keyword_lower in text_lower:
+            return index
+    return None
+
+
+def _make_category_finder(domain, role_name):
+    """Return a skill_name -> category function for the skills of one role.
+    
+    Role-level work (lowercasing, matching the role name against the domain's
+    keywords, resolving the default) is done once here instead of per skill.
+    """
+    if domain not in _CATEGORY_INDEX:
+        return lambda skill_name: "General"
+    
+    categories = _CATEGORY_INDEX[domain]
+    role_hit = _first_category_keyword(role_name.lower(), domain)
+    default_category = DEFAULT_CATEGORIES.get(domain, 'General')
+    
+    def find_category(skill_name):
+        # The first keyword found in either the skill or the role wins
+        skill_hit = _first_category_keyword(skill_name.lower(), domain)
+        if skill_hit is None:
+            first = role_hit
+        elif role_hit is None:
+            first = skill_hit
+        else:
+            first = min(skill_hit, role_hit)
+        return default_category if first is None else categories[first][0]
+    
+    return find_category
+
+
 def find_category_for_skill(skill_name, role_name, domain):
     """Find the best matching category for a skill within a domain."""
-    skill_lower = skill_name.lower()
-    role_lower = role_name.lower()
-    
-    if domain not in CATEGORY_MAPPINGS:
-        return "General"
-    
-    categories = CATEGORY_MAPPINGS[domain]
-    
-    # Check each category
-    for category, keywords in categories.items():
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            if keyword_lower in skill_lower or keyword_lower in role_lower:
-                return category
-    
-    # Default category based on domain
-    default_categories = {
-        'Web Development': 'Web Technologies',
-        'Mobile Development': 'Mobile Technologies',
-        'Artificial Intelligence & Machine Learning': 'AI/ML Technologies',
-        'Data Engineering & Analytics': 'Data Technologies',
-        'DevOps & Cloud': 'DevOps Tools',
-        'Programming Languages': 'Language Features',
-        'Computer Science Fundamentals': 'CS Concepts',
-        'Databases': 'Database Technologies',
-        'Game Development': 'Game Technologies',
-        'Design & UX': 'Design Principles',
-        'Blockchain': 'Blockchain Technologies',
-        'Cyber Security': 'Security Practices',
-        'Management & Leadership': 'Management Skills',
-        'Specialized Tools & Frameworks': 'Tools & Frameworks'
-    }
-    
-    return default_categories.get(domain, 'General')
+    return _make_category_finder(domain, role_name)(skill_name)
 
 
-def restructure_to_domains(input_file, output_file):
+def iter_roles(input_file):
+    """Yield role objects from the input JSON, one at a time when ijson is available."""
+    if ijson is not None:
+        with open(input_file, 'rb') as f:
+            yield from ijson.items(f, 'roles.item', use_float=True)
+    else:
+        yield from load_json(input_file)['roles']
+
+
+def _classify_role(role_obj):
+    """Resolve a role's domain and the category of each of its skills.
+    
+    Returns (domain, [(category, subskill), ...]), or None for a role without a
+    name. Kept at module level so worker processes can run it.
+    """
+    role_name = role_obj.get('role', '')
+    if not role_name:
+        return None
+    
+    # Find domain
+    domain = find_domain_for_role(role_name)
+    
+    # Process skills
+    find_category = _make_category_finder(domain, role_name)
+    entries = []
+    for skill in role_obj.get('skills', []):
+        skill_name = skill.get('name', '')
+        if not skill_name:
+            continue
+        
+        # Find category
+        category = find_category(skill_name)
+        
+        # Create subskill entry; cleaned roadmaps always carry these fields,
+        # so index directly and only fall back to defaults when one is missing
+        try:
+            subskill = Subskill(skill['skill_id'], skill_name, skill['keywords'], skill['links'])
+        except KeyError:
+            subskill = Subskill(
+                skill.get('skill_id', ''),
+                skill_name,
+                skill.get('keywords', []),
+                skill.get('links', [])
+            )
+        entries.append((category, subskill))
+    
+    return domain, entries
+
+
+def restructure_to_domains(input_file, output_file, workers=1):
     """Main restructuring function."""
     print(f"Loading {input_file}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
     
-    # Build domain structure
-    domains_dict = defaultdict(lambda: {
-        'umbrella': '',
-        'description': '',
-        'skills': defaultdict(lambda: {'category': '', 'subskills': []})
-    })
+    # Build domain structure: domain -> {'umbrella', 'description', 'skills': {category: [subskill, ...]}}
+    domains_dict = {}
     
     print("Processing roles and mapping to domains...")
-    all_roles = [r['role'] for r in data['roles']]
     
-    for role_obj in data['roles']:
-        role_name = role_obj.get('role', '')
-        if not role_name:
+    for classified in iter_pool_map(_classify_role, iter_roles(input_file), workers,
+                                    ROLE_BATCH_SIZE, WORKER_CHUNKSIZE):
+        if classified is None:
             continue
-        
-        # Find domain
-        domain = find_domain_for_role(role_name, all_roles)
+        domain, entries = classified
         
         # Initialize domain if needed
-        if not domains_dict[domain]['umbrella']:
-            domains_dict[domain]['umbrella'] = domain
-            domains_dict[domain]['description'] = DOMAIN_MAPPINGS.get(domain, {}).get('description', 
-                f'Skills and technologies related to {domain.lower()}.')
-        
-        # Process skills
-        for skill in role_obj.get('skills', []):
-            skill_name = skill.get('name', '')
-            if not skill_name:
-                continue
-            
-            # Find category
-            category = find_category_for_skill(skill_name, role_name, domain)
-            
-            # Create subskill entry
-            subskill = {
-                'skill_id': skill.get('skill_id', ''),
-                'name': skill_name,
-                'keywords': skill.get('keywords', []),
-                'links': skill.get('links', [])
+        domain_data = domains_dict.get(domain)
+        if domain_data is None:
+            domain_data = domains_dict[domain] = {
+                'umbrella': domain,
+                'description': DOMAIN_MAPPINGS.get(domain, {}).get('description',
+                    f'Skills and technologies related to {domain.lower()}.'),
+                'skills': {}
             }
-            
-            # Add to domain
-            category_key = category
-            if not domains_dict[domain]['skills'][category_key]['category']:
-                domains_dict[domain]['skills'][category_key]['category'] = category
-            
-            domains_dict[domain]['skills'][category_key]['subskills'].append(subskill)
+        domain_skills = domain_data['skills']
+        
+        # Add to domain
+        for category, subskill in entries:
+            domain_skills.setdefault(category, []).append(subskill)
     
-    # Convert to final structure
+    # Convert to final structure, writing each domain as soon as it is built so
+    # only one domain's output dicts exist at a time
     print("Building final domain structure...")
-    domains_list = []
+    print(f"Writing restructured data to {output_file}...")
+    domain_sizes = []  # (umbrella, categories, subskills) per written domain
     
-    for domain_name, domain_data in sorted(domains_dict.items()):
-        skills_list = []
-        
-        for category_name, category_data in sorted(domain_data['skills'].items()):
-            if category_data['subskills']:
-                skills_list.append({
-                    'category': category_data['category'],
-                    'subskills': category_data['subskills']
-                })
+    with open(output_file, 'wb') as f:
+        f.write(b'{\n  "domains": [')
         
-        if skills_list:
-            domains_list.append({
+        for domain_name, domain_data in sorted(domains_dict.items(), key=itemgetter(0)):
+            # Categories only exist once they hold a subskill
+            skills_list = [
+                {'category': category, 'subskills': [subskill._asdict() for subskill in subskills]}
+                for category, subskills in sorted(domain_data['skills'].items(), key=itemgetter(0))
+            ]
+            if not skills_list:
+                continue
+            
+            f.write(b',\n    ' if domain_sizes else b'\n    ')
+            f.write(encode_json_chunk({
                 'umbrella': domain_data['umbrella'],
                 'description': domain_data['description'],
                 'skills': skills_list
-            })
-    
-    output_data = {
-        'domains': domains_list
-    }
-    
-    print(f"Writing restructured data to {output_file}...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+            }, level=2))
+            domain_sizes.append((
+                domain_data['umbrella'],
+                len(skills_list),
+                sum(len(cat['subskills']) for cat in skills_list)
+            ))
+        
+        f.write(b'\n  ]\n}' if domain_sizes else b']\n}')
     
     # Print summary
-    total_domains = len(domains_list)
-    total_categories = sum(len(d['skills']) for d in domains_list)
-    total_subskills = sum(
-        sum(len(cat['subskills']) for cat in d['skills'])
-        for d in domains_list
+    total_domains = len(domain_sizes)
+    total_categories = sum(categories_count for _, categories_count, _ in domain_sizes)
+    total_subskills = sum(subskills_count for _, _, subskills_count in domain_sizes)
+    
+    # Emitted with a single write rather than one print per line
+    summary_lines = [
+        "\n" + "="*60,
+        "RESTRUCTURING SUMMARY",
+        "="*60,
+        f"Domains (umbrellas): {total_domains}",
+        f"Categories: {total_categories}",
+        f"Subskills: {total_subskills}",
+        "\nDomains:",
+    ]
+    summary_lines.extend(
+        f"  - {umbrella}: {categories_count} categories, {subskills_count} subskills"
+        for umbrella, categories_count, subskills_count in domain_sizes
     )
+    summary_lines.append(f"\nOutput file: {output_file.relative_to(REPO_ROOT)}")
+    summary_lines.append("="*60)
+    print("\n".join(summary_lines))
     
-    print("\n" + "="*60)
-    print("RESTRUCTURING SUMMARY")
-    print("="*60)
-    print(f"Domains (umbrellas): {total_domains}")
-    print(f"Categories: {total_categories}")
-    print(f"Subskills: {total_subskills}")
-    print(f"\nDomains:")
-    for domain in domains_list:
-        categories_count = len(domain['skills'])
-        subskills_count = sum(len(cat['subskills']) for cat in domain['skills'])
-        print(f"  - {domain['umbrella']}: {categories_count} categories, {subskills_count} subskills")
-    print(f"\nOutput file: {output_file.relative_to(REPO_ROOT)}")
-    print("="*60)
-    
-    # Validate JSON
-    try:
-        with open(output_file, 'r', encoding='utf-8') as f:
-            json.load(f)
-        print("\n[OK] Output JSON is valid")
-    except Exception as e:
-        print(f"\n[ERROR] JSON validation failed: {e}")
-        sys.exit(1)
+    check_output_written(output_file)
 
 
 if __name__ == "__main__":
-    restructure_to_domains(INPUT_FILE, OUTPUT_FILE)
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Restructure roadmaps into hierarchical domains')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for role classification (default: 1, since the bundled '
+                             'roadmap data is processed faster than a worker pool starts)')
+    args = parser.parse_args()
+    
+    restructure_to_domains(INPUT_FILE, OUTPUT_FILE, workers=args.workers)
 
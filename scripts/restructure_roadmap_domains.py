@@ -5,16 +5,36 @@ Restructure roadmaps_domains.json to use specific roadmap.sh titles as domains.
 Transforms broad categories into specific roadmap-based career paths.
 """
 
-import json
 import re
 import sys
 from pathlib import Path
 from collections import defaultdict
+from itertools import chain, tee
+from operator import itemgetter
+
+from json_output import check_output_written, encode_json_chunk, load_json
+from worker_pool import iter_pool_map
+
+# Optional: pyahocorasick finds every scoring keyword in a skill's text in one pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: ijson streams subskills from the input instead of loading it whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 REPO_ROOT = Path(__file__).parent.parent
 INPUT_FILE = REPO_ROOT / "data" / "roadmaps_domains.json"
 OUTPUT_FILE = REPO_ROOT / "data" / "roadmaps_roadmap_based.json"
 
+# Skills handed to the worker pool at a time, and per-task chunk size
+SKILL_BATCH_SIZE = 1000
+WORKER_CHUNKSIZE = 64
+
 # Roadmap title mappings (from roadmap.sh)
 ROADMAP_DOMAINS = {
     # Web Development
@@ -308,65 +328,135 @@ def normalize_text(text):
     return text.lower().strip()
 
 
+# Domain scoring looks for a fixed set of lowercased substrings in each skill's
+# text; index them once so a skill only touches the domains it mentions
+_DOMAIN_NAMES = tuple(ROADMAP_DOMAINS)
+_SCORING_NEEDLES = []
+_SCORING_NEEDLE_IDS = {}
+
+
+def _needle_id(needle):
+    """Index of needle in _SCORING_NEEDLES, adding it if new."""
+    index = _SCORING_NEEDLE_IDS.get(needle)
+    if index is None:
+        index = _SCORING_NEEDLE_IDS[needle] = len(_SCORING_NEEDLES)
+        _SCORING_NEEDLES.append(needle)
+    return index
+
+
+# Needle index -> domains whose name bonus it triggers / (domain, weight) keyword scores
+_NAME_BONUS_DOMAINS = {}
+_KEYWORD_WEIGHTS = {}
+for _domain_index, (_domain_name, _domain_info) in enumerate(ROADMAP_DOMAINS.items()):
+    _domain_name_lower = normalize_text(_domain_name)
+    # Exact domain name, or any of its words longer than 3 characters
+    for _needle in [_domain_name_lower] + [word for word in _domain_name_lower.split() if len(word) > 3]:
+        _NAME_BONUS_DOMAINS.setdefault(_needle_id(_needle), set()).add(_domain_index)
+    # First 3 keywords are most important
+    for _position, _keyword in enumerate(_domain_info['keywords']):
+        _KEYWORD_WEIGHTS.setdefault(_needle_id(normalize_text(_keyword)), []).append(
+            (_domain_index, 5 if _position < 3 else 2))
+
+
+def _penalty(domain_terms, trigger_terms, when_present, amount):
+    """Build a (domains, trigger needles, when_present, amount) negative scoring rule.
+    
+    Domains whose lowercased name contains one of domain_terms lose amount when
+    a trigger term is present in (or, if not when_present, absent from) the text.
+    """
+    domains = frozenset(
+        index for index, name in enumerate(_DOMAIN_NAMES)
+        if any(term in normalize_text(name) for term in domain_terms)
+    )
+    return domains, frozenset(_needle_id(term) for term in trigger_terms), when_present, amount
+
+
+_PENALTIES = (
+    # Frontend shouldn't have ML/backend keywords
+    _penalty(['frontend'], ['machine learning', 'ml', 'backend', 'server', 'database', 'sql'], True, 10),
+    # Backend shouldn't have frontend-specific keywords
+    _penalty(['backend'], ['html', 'css', 'react', 'vue', 'angular', 'frontend'], True, 5),
+    # AI/ML domains should prioritize AI/ML keywords
+    _penalty(['ai', 'machine learning', 'ml'],
+             ['ai', 'machine learning', 'ml', 'neural', 'tensorflow', 'pytorch', 'llm', 'agent'], False, 5),
+)
+
+# Needle index -> domains counting it as a keyword hit for unmapped skills
+_FALLBACK_KEYWORD_DOMAINS = {}
+for _domain_index, _domain_info in enumerate(ROADMAP_DOMAINS.values()):
+    for _keyword in _domain_info['keywords']:
+        _FALLBACK_KEYWORD_DOMAINS.setdefault(_needle_id(_keyword.lower()), []).append(_domain_index)
+
+_SCORING_AUTOMATON = None
+if ahocorasick is not None:
+    _SCORING_AUTOMATON = ahocorasick.Automaton()
+    for _index, _needle in enumerate(_SCORING_NEEDLES):
+        _SCORING_AUTOMATON.add_word(_needle, _index)
+    _SCORING_AUTOMATON.make_automaton()
+
+
+def _present_needles(text):
+    """Set of _SCORING_NEEDLES indices occurring in text."""
+    if _SCORING_AUTOMATON is not None:
+        return {index for _, index in _SCORING_AUTOMATON.iter(text)}
+    return {index for index, needle in enumerate(_SCORING_NEEDLES) if needle in text}
+
+
 def find_best_roadmap_domain(skill_name, skill_keywords, skill_links):
     """Find the best matching roadmap domain for a skill."""
     skill_text = normalize_text(skill_name)
     all_keywords = ' '.join([skill_text] + [normalize_text(k) for k in skill_keywords])
     links_text = ' '.join(skill_links).lower()
     combined_text = f"{all_keywords} {links_text}"
+    present = _present_needles(combined_text)
     
-    # Score each domain
+    # Score the domains the text mentions; every other domain scores 0 or less
     domain_scores = {}
-    for domain_name, domain_info in ROADMAP_DOMAINS.items():
-        score = 0
-        domain_keywords = [normalize_text(k) for k in domain_info['keywords']]
-        domain_name_lower = normalize_text(domain_name)
-        
-        # High priority: exact domain name match
-        if domain_name_lower in combined_text or any(word in combined_text for word in domain_name_lower.split() if len(word) > 3):
-            score += 10
-        
-        # High priority: primary domain keywords
-        primary_keywords = domain_keywords[:3]  # First 3 are most important
-        for keyword in primary_keywords:
-            if keyword in combined_text:
-                score += 5
-        
-        # Medium priority: other domain keywords
-        for keyword in domain_keywords[3:]:
-            if keyword in combined_text:
-                score += 2
-        
-        # Negative scoring for clearly wrong matches
-        # Frontend shouldn't have ML/backend keywords
-        if 'frontend' in domain_name_lower:
-            if any(kw in combined_text for kw in ['machine learning', 'ml', 'backend', 'server', 'database', 'sql']):
-                score -= 10
-        
-        # Backend shouldn't have frontend-specific keywords
-        if 'backend' in domain_name_lower:
-            if any(kw in combined_text for kw in ['html', 'css', 'react', 'vue', 'angular', 'frontend']):
-                score -= 5
-        
-        # AI/ML domains should prioritize AI/ML keywords
-        if any(term in domain_name_lower for term in ['ai', 'machine learning', 'ml']):
-            if not any(kw in combined_text for kw in ['ai', 'machine learning', 'ml', 'neural', 'tensorflow', 'pytorch', 'llm', 'agent']):
-                score -= 5
-        
-        domain_scores[domain_name] = score
+    named = set()
+    for index in present:
+        named.update(_NAME_BONUS_DOMAINS.get(index, ()))
+        for domain_index, weight in _KEYWORD_WEIGHTS.get(index, ()):
+            domain_scores[domain_index] = domain_scores.get(domain_index, 0) + weight
+    for domain_index in named:
+        domain_scores[domain_index] = domain_scores.get(domain_index, 0) + 10
+    
+    # Negative scoring for clearly wrong matches
+    for domains, triggers, when_present, amount in _PENALTIES:
+        if triggers.isdisjoint(present) != when_present:
+            for domain_index in domains.intersection(domain_scores):
+                domain_scores[domain_index] -= amount
+    
+    # Return best match only if score is positive; ties go to the first domain listed
+    best = max(((score, -domain_index) for domain_index, score in domain_scores.items() if score > 0),
+               default=None)
+    return None if best is None else _DOMAIN_NAMES[-best[1]]
+
+
+def find_closest_roadmap_domain(skill_name, skill_keywords):
+    """Find the domain with the most keywords in a skill's name and keywords.
     
-    # Return best match only if score is positive
-    if domain_scores:
-        best_domain = max(domain_scores.items(), key=lambda x: x[1])
-        if best_domain[1] > 0:
-            return best_domain[0]
+    Fallback for skills find_best_roadmap_domain leaves unmapped: no weights,
+    no negative scoring and no links. Returns None when no keyword matches.
+    """
+    skill_text = ' '.join([skill_name] + skill_keywords).lower()
     
-    return None
+    domain_scores = {}
+    for index in _present_needles(skill_text):
+        for domain_index in _FALLBACK_KEYWORD_DOMAINS.get(index, ()):
+            domain_scores[domain_index] = domain_scores.get(domain_index, 0) + 1
+    
+    # Ties go to the first domain listed
+    best = max(((score, -domain_index) for domain_index, score in domain_scores.items()), default=None)
+    return None if best is None else _DOMAIN_NAMES[-best[1]]
+
+
+# Qualifying suffix dropped from a skill's base key ("x in y", "x for y", "x - y")
+_BASE_KEY_SUFFIX_RE = re.compile(r'(?:\s+(?:in|for|with|using|via)\s+.*|\s+-\s+.*)$')
 
 
 def merge_similar_skills(skills):
     """Merge overly specific skills into broader categories."""
-    merged = {}
+    merged = {}  # base key -> skills sharing it, in input order
     
     # Group by base name (first 2-3 words)
     for skill in skills:
@@ -380,59 +470,71 @@ def merge_similar_skills(skills):
             base_key = name.lower()
         
         # Normalize base key
-        base_key = re.sub(r'\s+(in|for|with|using|via)\s+.*$', '', base_key)
-        base_key = re.sub(r'\s+-\s+.*$', '', base_key)
+        base_key = _BASE_KEY_SUFFIX_RE.sub('', base_key)
         
-        if base_key not in merged:
-            merged[base_key] = {
-                'skill_id': skill['skill_id'],
-                'name': name,
-                'keywords': set(skill.get('keywords', [])),
-                'links': list(set(skill.get('links', [])))
-            }
-        else:
-            # Merge keywords and links
-            merged[base_key]['keywords'].update(skill.get('keywords', []))
-            merged[base_key]['links'].extend(skill.get('links', []))
-            merged[base_key]['links'] = list(set(merged[base_key]['links']))
-            # Keep longer/more descriptive name
-            if len(name) > len(merged[base_key]['name']):
-                merged[base_key]['name'] = name
+        merged.setdefault(base_key, []).append(skill)
     
-    # Convert back to list format
+    # Convert back to list format, merging each group's keywords and links once
     result = []
-    for base_key, merged_skill in merged.items():
+    for group in merged.values():
         result.append({
-            'skill_id': merged_skill['skill_id'],
-            'name': merged_skill['name'],
-            'keywords': sorted(list(merged_skill['keywords'])),
-            'links': merged_skill['links']
+            'skill_id': group[0]['skill_id'],
+            # Keep longer/more descriptive name
+            'name': max((skill['name'] for skill in group), key=len),
+            'keywords': sorted({keyword for skill in group for keyword in skill.get('keywords', [])}),
+            'links': sorted({link for skill in group for link in skill.get('links', [])})
         })
     
     return result
 
 
+# Common category patterns
+CATEGORY_PATTERNS = {
+    'Fundamentals': ['basic', 'fundamental', 'introduction', 'getting started', 'overview'],
+    'Core Concepts': ['core', 'concept', 'theory', 'principles'],
+    'Frameworks & Libraries': ['framework', 'library', 'package', 'module'],
+    'Tools & Setup': ['tool', 'setup', 'installation', 'configuration', 'environment'],
+    'Advanced Topics': ['advanced', 'expert', 'optimization', 'performance'],
+    'Testing': ['test', 'testing', 'qa', 'quality'],
+    'Deployment': ['deploy', 'deployment', 'production', 'hosting'],
+    'Security': ['security', 'auth', 'authentication', 'authorization', 'encryption'],
+    'APIs & Integration': ['api', 'rest', 'graphql', 'integration', 'endpoint'],
+    'Database': ['database', 'db', 'sql', 'nosql', 'query'],
+    'DevOps': ['devops', 'ci/cd', 'docker', 'kubernetes', 'terraform'],
+    'Cloud': ['cloud', 'aws', 'azure', 'gcp', 'serverless'],
+    'Mobile': ['mobile', 'android', 'ios', 'react native', 'flutter'],
+    'Frontend': ['frontend', 'ui', 'ux', 'html', 'css', 'javascript'],
+    'Backend': ['backend', 'server', 'nodejs', 'python', 'java']
+}
+
+# (category, pattern) pairs in priority order: the first pattern found in a
+# skill's text always belongs to the first category with any pattern found
+_CATEGORY_PATTERN_PAIRS = tuple(
+    (category, pattern) for category, patterns in CATEGORY_PATTERNS.items() for pattern in patterns
+)
+
+_CATEGORY_AUTOMATON = None
+if ahocorasick is not None:
+    _CATEGORY_AUTOMATON = ahocorasick.Automaton()
+    for _index, (_, _pattern) in enumerate(_CATEGORY_PATTERN_PAIRS):
+        if _pattern not in _CATEGORY_AUTOMATON:
+            _CATEGORY_AUTOMATON.add_word(_pattern, _index)
+    _CATEGORY_AUTOMATON.make_automaton()
+
+
+def find_pattern_category(text):
+    """First category in CATEGORY_PATTERNS with a pattern occurring in text, or None."""
+    if _CATEGORY_AUTOMATON is not None:
+        first = min((index for _, index in _CATEGORY_AUTOMATON.iter(text)), default=None)
+        return None if first is None else _CATEGORY_PATTERN_PAIRS[first][0]
+    for category, pattern in _CATEGORY_PATTERN_PAIRS:
+        if pattern in text:
+            return category
+    return None
+
+
 def create_categories_for_domain(domain_name, skills):
     """Create logical categories for skills within a domain."""
-    # Common category patterns
-    category_patterns = {
-        'Fundamentals': ['basic', 'fundamental', 'introduction', 'getting started', 'overview'],
-        'Core Concepts': ['core', 'concept', 'theory', 'principles'],
-        'Frameworks & Libraries': ['framework', 'library', 'package', 'module'],
-        'Tools & Setup': ['tool', 'setup', 'installation', 'configuration', 'environment'],
-        'Advanced Topics': ['advanced', 'expert', 'optimization', 'performance'],
-        'Testing': ['test', 'testing', 'qa', 'quality'],
-        'Deployment': ['deploy', 'deployment', 'production', 'hosting'],
-        'Security': ['security', 'auth', 'authentication', 'authorization', 'encryption'],
-        'APIs & Integration': ['api', 'rest', 'graphql', 'integration', 'endpoint'],
-        'Database': ['database', 'db', 'sql', 'nosql', 'query'],
-        'DevOps': ['devops', 'ci/cd', 'docker', 'kubernetes', 'terraform'],
-        'Cloud': ['cloud', 'aws', 'azure', 'gcp', 'serverless'],
-        'Mobile': ['mobile', 'android', 'ios', 'react native', 'flutter'],
-        'Frontend': ['frontend', 'ui', 'ux', 'html', 'css', 'javascript'],
-        'Backend': ['backend', 'server', 'nodejs', 'python', 'java']
-    }
-    
     # Group skills into categories
     categorized = defaultdict(list)
     uncategorized = []
@@ -442,14 +544,10 @@ def create_categories_for_domain(domain_name, skills):
         skill_keywords_lower = ' '.join([k.lower() for k in skill.get('keywords', [])])
         combined = f"{skill_lower} {skill_keywords_lower}"
         
-        categorized_flag = False
-        for category, patterns in category_patterns.items():
-            if any(pattern in combined for pattern in patterns):
-                categorized[category].append(skill)
-                categorized_flag = True
-                break
-        
-        if not categorized_flag:
+        category = find_pattern_category(combined)
+        if category:
+            categorized[category].append(skill)
+        else:
             uncategorized.append(skill)
     
     # Create category list
@@ -478,101 +576,112 @@ def create_categories_for_domain(domain_name, skills):
     return categories
 
 
-def restructure_to_roadmap_domains(input_file, output_file):
+def resolve_skill_domain(skill):
+    """Return (domain, mapped) for a skill.
+    
+    mapped is False when find_best_roadmap_domain found nothing and the domain
+    came from the keyword fallback. Kept at module level so worker processes
+    can run it.
+    """
+    skill_name = skill.get('name', '')
+    skill_keywords = skill.get('keywords', [])
+    skill_links = skill.get('links', [])
+    
+    domain = find_best_roadmap_domain(skill_name, skill_keywords, skill_links)
+    if domain:
+        return domain, True
+    
+    # Try to find a match based on keywords, else default to the most common domain
+    return find_closest_roadmap_domain(skill_name, skill_keywords) or "Frontend Developer", False
+
+
+def iter_subskills(input_file):
+    """Yield every subskill in the input JSON, one at a time when ijson is available."""
+    if ijson is not None:
+        # ijson builds fresh key strings for every object; intern them so the
+        # skills held until output share one copy of each key, as the json parsers do
+        with open(input_file, 'rb') as f:
+            for subskill in ijson.items(f, 'domains.item.skills.item.subskills.item', use_float=True):
+                yield {sys.intern(key): value for key, value in subskill.items()}
+        return
+    
+    data = load_json(input_file)
+    yield from chain.from_iterable(
+        skill_group.get('subskills', [])
+        for domain in data.get('domains', [])
+        for skill_group in domain.get('skills', [])
+    )
+
+
+def restructure_to_roadmap_domains(input_file, output_file, workers=1):
     """Main restructuring function."""
     print(f"Loading {input_file}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
     
-    # Collect all skills from current structure
-    all_skills = []
-    for domain in data.get('domains', []):
-        for skill_group in domain.get('skills', []):
-            for subskill in skill_group.get('subskills', []):
-                all_skills.append(subskill)
-    
-    print(f"Found {len(all_skills)} total skills")
     print("Mapping skills to roadmap domains...")
     
-    # Map skills to roadmap domains
+    # Map skills to roadmap domains as they are read; unmapped skills are assigned
+    # to the closest domain right away but kept after that domain's mapped skills.
+    # tee only buffers the skills the worker pool has been handed but not yet returned
+    skills, to_resolve = tee(iter_subskills(input_file))
+    resolved = iter_pool_map(resolve_skill_domain, to_resolve, workers,
+                             SKILL_BATCH_SIZE, WORKER_CHUNKSIZE)
     domain_skills = defaultdict(list)
-    unmapped_skills = []
+    fallback_skills = defaultdict(list)
+    total_count = 0
+    unmapped_count = 0
     
-    for skill in all_skills:
-        skill_name = skill.get('name', '')
-        skill_keywords = skill.get('keywords', [])
-        skill_links = skill.get('links', [])
-        
-        domain = find_best_roadmap_domain(skill_name, skill_keywords, skill_links)
-        if domain:
+    for skill, (domain, mapped) in zip(skills, resolved):
+        total_count += 1
+        if mapped:
             domain_skills[domain].append(skill)
         else:
-            unmapped_skills.append(skill)
-    
-    # Handle unmapped skills - assign to closest domain
-    print(f"Handling {len(unmapped_skills)} unmapped skills...")
-    for skill in unmapped_skills:
-        # Try to find a match based on keywords
-        best_match = None
-        best_score = 0
-        
-        for domain_name, domain_info in ROADMAP_DOMAINS.items():
-            score = 0
-            skill_text = ' '.join([skill.get('name', '')] + skill.get('keywords', [])).lower()
-            for keyword in domain_info['keywords']:
-                if keyword.lower() in skill_text:
-                    score += 1
-            
-            if score > best_score:
-                best_score = score
-                best_match = domain_name
-        
-        if best_match:
-            domain_skills[best_match].append(skill)
-        else:
-            # Default to "General" or most common domain
-            domain_skills["Frontend Developer"].append(skill)
+            unmapped_count += 1
+            fallback_skills[domain].append(skill)
+    
+    print(f"Found {total_count} total skills")
+    print(f"Handling {unmapped_count} unmapped skills...")
+    for domain, skills in fallback_skills.items():
+        domain_skills[domain].extend(skills)
     
     print("Merging similar skills and creating categories...")
     
-    # Build final structure
-    domains_list = []
-    for domain_name in sorted(ROADMAP_DOMAINS.keys()):
-        if domain_name not in domain_skills or not domain_skills[domain_name]:
-            continue
-        
-        skills = domain_skills[domain_name]
-        
-        # Merge similar skills
-        merged_skills = merge_similar_skills(skills)
-        
-        # Create categories
-        categories = create_categories_for_domain(domain_name, merged_skills)
+    # Build final structure; each domain is merged, categorized and written
+    # before the next one is started
+    print(f"Writing restructured data to {output_file}...")
+    domain_sizes = []  # (domain, categories, subskills) per written domain
+    
+    with open(output_file, 'wb') as f:
+        f.write(b'{\n  "domains": [')
         
-        # Get description
-        description = ROADMAP_DOMAINS[domain_name]['description']
+        # Only domains that received a skill have an entry, and every entry is non-empty
+        for domain_name, skills in sorted(domain_skills.items(), key=itemgetter(0)):
+            # Merge similar skills
+            merged_skills = merge_similar_skills(skills)
+            
+            # Create categories
+            categories = create_categories_for_domain(domain_name, merged_skills)
+            
+            # Get description
+            description = ROADMAP_DOMAINS[domain_name]['description']
+            
+            f.write(b',\n    ' if domain_sizes else b'\n    ')
+            f.write(encode_json_chunk({
+                'domain': domain_name,
+                'description': description,
+                'categories': categories
+            }, level=2))
+            domain_sizes.append((
+                domain_name,
+                len(categories),
+                sum(len(cat['subskills']) for cat in categories)
+            ))
         
-        domains_list.append({
-            'domain': domain_name,
-            'description': description,
-            'categories': categories
-        })
-    
-    output_data = {
-        'domains': domains_list
-    }
-    
-    print(f"Writing restructured data to {output_file}...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+        f.write(b'\n  ]\n}' if domain_sizes else b']\n}')
     
     # Print summary
-    total_domains = len(domains_list)
-    total_categories = sum(len(d['categories']) for d in domains_list)
-    total_subskills = sum(
-        sum(len(cat['subskills']) for cat in d['categories'])
-        for d in domains_list
-    )
+    total_domains = len(domain_sizes)
+    total_categories = sum(categories_count for _, categories_count, _ in domain_sizes)
+    total_subskills = sum(subskills_count for _, _, subskills_count in domain_sizes)
     
     print("\n" + "="*60)
     print("RESTRUCTURING SUMMARY")
@@ -581,23 +690,24 @@ def restructure_to_roadmap_domains(input_file, output_file):
     print(f"Categories: {total_categories}")
     print(f"Subskills: {total_subskills}")
     print(f"\nTop domains by subskill count:")
-    domain_counts = [(d['domain'], sum(len(c['subskills']) for c in d['categories'])) for d in domains_list]
+    domain_counts = [(domain, subskills_count) for domain, _, subskills_count in domain_sizes]
     domain_counts.sort(key=lambda x: x[1], reverse=True)
     for domain, count in domain_counts[:10]:
         print(f"  - {domain}: {count} subskills")
     print(f"\nOutput file: {output_file.relative_to(REPO_ROOT)}")
     print("="*60)
     
-    # Validate JSON
-    try:
-        with open(output_file, 'r', encoding='utf-8') as f:
-            json.load(f)
-        print("\n[OK] Output JSON is valid")
-    except Exception as e:
-        print(f"\n[ERROR] JSON validation failed: {e}")
-        sys.exit(1)
+    check_output_written(output_file)
 
 
 if __name__ == "__main__":
-    restructure_to_roadmap_domains(INPUT_FILE, OUTPUT_FILE)
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Restructure domains into roadmap.sh career paths')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for skill-to-domain mapping (default: 1, since the bundled '
+                             'roadmap data is processed faster than a worker pool starts)')
+    args = parser.parse_args()
+    
+    restructure_to_roadmap_domains(INPUT_FILE, OUTPUT_FILE, workers=args.workers)
 
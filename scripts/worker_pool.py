@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Process-pool mapping shared by the data-processing scripts.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+
+def iter_pool_map(func, items, workers=1, batch_size=500, chunksize=64):
+    """Yield func(item) for each item, in input order.
+
+    With workers <= 1 everything runs in this process. Otherwise items are sent
+    to a pool of that many worker processes batch_size at a time, chunksize per
+    task, so a long or streamed input is never queued all at once. func must be
+    a module-level function so workers can unpickle it.
+    """
+    if workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    items = iter(items)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            batch = list(islice(items, batch_size))
+            if not batch:
+                return
+            yield from executor.map(func, batch, chunksize=chunksize)